@@ -7,6 +7,7 @@ from .store import (
     AuthType,
     PROVIDER_NAMES,
     get,
+    get_all_provider_configs,
     get_api_key,
     get_provider_config,
     list_providers,
@@ -21,6 +22,7 @@ __all__ = [
     "AuthType",
     "PROVIDER_NAMES",
     "get",
+    "get_all_provider_configs",
     "get_api_key",
     "get_provider_config",
     "list_providers",
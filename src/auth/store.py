@@ -11,16 +11,21 @@ import os
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Optional, cast
 
 from rich.console import Console
 
+from .. import json_io
+
 console = Console()
 
 # Storage location for auth credentials
 AUTH_DIR = Path.home() / ".local" / "share" / "repo_translate"
 AUTH_FILE = AUTH_DIR / "auth.json"
 
+# Parsed auth data cached as (mtime_ns, data), refreshed when the file changes
+_cache: Optional[tuple[int, dict]] = None
+
 # Provider display names
 PROVIDER_NAMES = {
     "openai": "OpenAI",
@@ -32,6 +37,9 @@ PROVIDER_NAMES = {
     "custom": "自定义 (Custom)",
 }
 
+# Environment variable holding the API key for each known provider (e.g. OPENAI_API_KEY)
+_ENV_VAR_NAMES = {provider: f"{provider.upper()}_API_KEY" for provider in PROVIDER_NAMES}
+
 
 class AuthType(Enum):
     """Supported authentication types."""
@@ -40,7 +48,7 @@ class AuthType(Enum):
     OAUTH = "oauth"
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthInfo:
     """Authentication information for a provider."""
 
@@ -55,16 +63,18 @@ class AuthInfo:
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         result = {"type": self.type.value}
-        if self.key:
-            result["key"] = self.key
-        if self.base_url:
-            result["base_url"] = self.base_url
-        if self.model:
-            result["model"] = self.model
-        if self.refresh_token:
-            result["refresh"] = self.refresh_token
-        if self.access_token:
-            result["access"] = self.access_token
+        result.update(
+            (k, v)
+            for k, v in (
+                ("key", self.key),
+                ("base_url", self.base_url),
+                ("model", self.model),
+                ("refresh", self.refresh_token),
+                ("access", self.access_token),
+            )
+            if v
+        )
+        # expires may legitimately be 0, so only skip it when unset
         if self.expires_at is not None:
             result["expires"] = self.expires_at
         return result
@@ -91,22 +101,37 @@ def _ensure_auth_dir() -> None:
 
 
 def _load_auth_data() -> dict:
-    """Load all auth data from file."""
-    if not AUTH_FILE.exists():
+    """Load all auth data from file.
+
+    The parsed data is cached and reused as long as the file's mtime is unchanged;
+    callers get a shallow copy, so changes that are never saved don't leak into it.
+    """
+    global _cache
+    try:
+        mtime = AUTH_FILE.stat().st_mtime_ns
+    except OSError:
         return {}
+    if _cache is not None and _cache[0] == mtime:
+        return dict(_cache[1])
     try:
-        with open(AUTH_FILE) as f:
-            return json.load(f)
+        data = cast(dict, json_io.loads(AUTH_FILE.read_bytes()))
     except (json.JSONDecodeError, OSError):
         return {}
+    _cache = (mtime, data)
+    return dict(data)
 
 
 def _save_auth_data(data: dict) -> None:
     """Save auth data to file with secure permissions."""
+    global _cache
     _ensure_auth_dir()
-    with open(AUTH_FILE, "w") as f:
-        json.dump(data, f, indent=2)
-    os.chmod(AUTH_FILE, 0o600)
+    # Create with 0o600 up front so the keys are never readable by others, and
+    # tighten an existing file's mode through the same descriptor
+    fd = os.open(AUTH_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        os.fchmod(fd, 0o600)
+        f.write(json_io.dumps_indented(data))
+    _cache = None
 
 
 def get(provider: str) -> Optional[AuthInfo]:
@@ -181,7 +206,7 @@ def get_api_key(provider: str) -> Optional[str]:
         API key if found, None otherwise
     """
     # Check environment variable first (e.g., OPENAI_API_KEY, DEEPSEEK_API_KEY)
-    env_var = f"{provider.upper()}_API_KEY"
+    env_var = _ENV_VAR_NAMES.get(provider) or f"{provider.upper()}_API_KEY"
     env_key = os.environ.get(env_var)
     if env_key:
         return env_key
@@ -203,15 +228,36 @@ def get_provider_config(provider: str) -> dict:
     Returns:
         Dictionary with api_key, base_url, model (all optional)
     """
+    return _build_provider_config(provider, _load_auth_data())
+
+
+def get_all_provider_configs() -> dict[str, dict]:
+    """Get configuration for every provider with stored credentials.
+
+    Reads the auth file once instead of once per provider.
+
+    Returns:
+        Dictionary mapping provider name to its config (see get_provider_config)
+    """
+    data = _load_auth_data()
+    return {provider: _build_provider_config(provider, data) for provider in data}
+
+
+def _build_provider_config(provider: str, data: dict) -> dict:
+    """Build provider configuration from already-loaded auth data."""
     result = {}
 
-    # Get API key
-    api_key = get_api_key(provider)
+    auth = AuthInfo.from_dict(data[provider]) if provider in data else None
+
+    # Get API key (environment variable first, then stored credentials)
+    env_var = _ENV_VAR_NAMES.get(provider) or f"{provider.upper()}_API_KEY"
+    api_key = os.environ.get(env_var)
+    if not api_key and auth:
+        api_key = auth.key
     if api_key:
         result["api_key"] = api_key
 
     # Get stored config
-    auth = get(provider)
     if auth:
         if auth.base_url:
             result["base_url"] = auth.base_url
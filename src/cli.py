@@ -1,18 +1,16 @@
 """Main CLI entry point for repo-translate."""
 
-import tempfile
+import os
+import shutil
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import typer
 from rich.console import Console
-from rich.progress import BarColumn, Progress, TextColumn, TimeRemainingColumn
-from rich.table import Table
 
 from .auth import (
     PROVIDER_NAMES,
-    get_provider_config,
-    list_providers,
+    get_all_provider_configs,
     remove,
     set_auth,
     AuthInfo,
@@ -25,15 +23,10 @@ from .config import (
     show_config_sources,
     GLOBAL_CONFIG_FILE,
 )
-from .parser import get_parser
-from .repo import (
-    clone_repo,
-    filter_translatable_files,
-    get_file_list,
-    parse_github_url,
-)
-from .translator import OpenAITranslator
-from .translator.openai import PROVIDER_BASE_URLS, PROVIDER_MODELS
+
+if TYPE_CHECKING:
+    from .parser import Parser, ParseResult
+    from .translator import OpenAITranslator
 
 app = typer.Typer(
     name="repo-translate",
@@ -54,6 +47,8 @@ SUPPORTED_LANGUAGES = {
     "it": "Italian (Italiano)",
     "ar": "Arabic (العربية)",
 }
+_SUPPORTED_LANG_CODES = frozenset(SUPPORTED_LANGUAGES)
+_SUPPORTED_LANG_STR = ", ".join(SUPPORTED_LANGUAGES)
 
 
 @app.command()
@@ -86,8 +81,34 @@ def translate(
     show_config: bool = typer.Option(
         False, "--show-config", help="Show configuration sources and exit"
     ),
+    batch_api: bool = typer.Option(
+        False,
+        "--batch-api",
+        help="Use the provider's Batch API for large files (cheaper, results may take hours)",
+    ),
+    max_concurrency: Optional[int] = typer.Option(
+        None, "--max-concurrency", help="Maximum concurrent API requests (default: 8)"
+    ),
+    rpm: Optional[int] = typer.Option(None, "--rpm", help="Maximum API requests per minute"),
+    tpm: Optional[int] = typer.Option(None, "--tpm", help="Maximum API tokens per minute"),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Don't reuse or store translations from earlier runs"
+    ),
 ):
-    cli_args = {}
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from contextlib import closing
+
+    from rich.progress import BarColumn, Progress, TextColumn, TimeRemainingColumn
+
+    from .parser import get_parser, parse_all
+    from .repo import (
+        clone_repo,
+        find_translatable_files,
+        parse_github_url,
+    )
+    from .translator import OpenAITranslator
+
+    cli_args: dict[str, Any] = {}
     if target_lang:
         cli_args["target_lang"] = target_lang
     if provider:
@@ -100,6 +121,14 @@ def translate(
         cli_args["model"] = model
     if dry_run is not None:
         cli_args["dry_run"] = dry_run
+    if max_concurrency:
+        cli_args["max_concurrency"] = max_concurrency
+    if rpm:
+        cli_args["rpm"] = rpm
+    if tpm:
+        cli_args["tpm"] = tpm
+    if no_cache:
+        cli_args["use_cache"] = False
 
     config = load_config(cli_args=cli_args)
 
@@ -107,9 +136,9 @@ def translate(
         show_config_sources(config)
         return
 
-    if config.target_lang not in SUPPORTED_LANGUAGES:
+    if config.target_lang not in _SUPPORTED_LANG_CODES:
         console.print(f"[red]Error:[/red] Unsupported language: {config.target_lang}")
-        console.print(f"Supported languages: {', '.join(SUPPORTED_LANGUAGES.keys())}")
+        console.print(f"Supported languages: {_SUPPORTED_LANG_STR}")
         raise typer.Exit(1)
 
     if not config.api_key and config.provider != "ollama":
@@ -118,13 +147,6 @@ def translate(
         console.print(f"Set via --api-key, config file, or REPO_TRANSLATE_API_KEY env")
         raise typer.Exit(1)
 
-    translator = OpenAITranslator(
-        api_key=config.api_key or "ollama",
-        base_url=config.base_url,
-        model=config.model,
-        provider=config.provider,
-    )
-
     provider_name = PROVIDER_NAMES.get(config.provider, config.provider)
     console.print(f"\n[bold cyan]repo-translate[/bold cyan]")
     console.print(f"Repository: {repo_url}")
@@ -146,8 +168,7 @@ def translate(
         progress.remove_task(clone_task)
 
         scan_task = progress.add_task("Scanning files...", total=None)
-        all_files = get_file_list(source_path)
-        file_groups = filter_translatable_files(all_files)
+        file_groups = find_translatable_files(source_path)
         progress.remove_task(scan_task)
 
     total_files = sum(len(files) for files in file_groups.values())
@@ -173,56 +194,117 @@ def translate(
         target_path = Path.cwd() / f"{source_path.name}_translated"
 
     if target_path.exists():
-        import shutil
-
         shutil.rmtree(target_path)
-    import shutil
-
-    shutil.copytree(source_path, target_path)
+    # Hard-link the tree; only files that get translated are rewritten (see Parser.write_file)
+    shutil.copytree(source_path, target_path, copy_function=_link_or_copy)
+
+    console.print(f"\n[cyan]→[/cyan] Parsing {total_files} files...")
+    parsers = {file_type: get_parser(file_type) for file_type in file_groups}
+    file_jobs = [
+        (target_path / file_path, file_type)
+        for file_type, file_paths in file_groups.items()
+        for file_path in file_paths
+    ]
+    parsed_files = []
+    for (file_path, file_type), parse_result in zip(file_jobs, parse_all(file_jobs, parsers)):
+        if parse_result is None:
+            console.print(
+                f"[yellow]![/yellow] Skipped unreadable file {file_path.relative_to(target_path)}"
+            )
+            continue
+        parsed_files.append((file_type, parse_result))
 
     console.print(f"\n[cyan]→[/cyan] Translating to {target_path}...")
 
-    with Progress(
+    # Created only now, so that dry runs don't open the translation cache
+    translator = OpenAITranslator(
+        api_key=config.api_key or "ollama",
+        base_url=config.base_url,
+        model=config.model,
+        provider=config.provider,
+        max_concurrency=config.max_concurrency,
+        rpm=config.rpm,
+        tpm=config.tpm,
+        use_cache=config.use_cache,
+        batch_api=batch_api,
+    )
+
+    with closing(translator), Progress(
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
         TimeRemainingColumn(),
         console=console,
     ) as progress:
-        main_task = progress.add_task("Translating...", total=total_files)
-
-        for file_type, files in file_groups.items():
-            parser = get_parser(file_type)
-
-            for file_path in files:
-                target_file = target_path / file_path
-
-                progress.update(main_task, description=f"Translating {file_path}")
-
-                content = parser.read_file(target_file)
-                parse_result = parser.parse(content, target_file)
-
-                comments_to_translate = {i: c.text for i, c in enumerate(parse_result.comments)}
-                blocks_to_translate = {i: b.text for i, b in enumerate(parse_result.text_blocks) if not b.is_code}
-                if comments_to_translate:
-                    translated_comments = translator.translate_file_comments(
-                        list(comments_to_translate.values()), config.target_lang, file_type
-                    )
-                    comment_map = dict(zip(comments_to_translate.keys(), translated_comments))
-                    content = parser.inject_translations(content, comment_map, parse_result)
-                if blocks_to_translate:
-                    translated_blocks = translator.translate_markdown_blocks(
-                        list(blocks_to_translate.values()), config.target_lang
-                    )
-                    block_map = dict(zip(blocks_to_translate.keys(), translated_blocks))
-                    content = parser.inject_translations(content, block_map, parse_result)
-
-                parser.write_file(target_file, content)
+        main_task = progress.add_task("Translating...", total=len(parsed_files))
+
+        # Files are translated concurrently; the work is dominated by API round-trips
+        with ThreadPoolExecutor(max_workers=config.batch_size) as executor:
+            futures = [
+                executor.submit(
+                    _translate_file,
+                    parsers[file_type],
+                    translator,
+                    parse_result,
+                    file_type,
+                    config.target_lang,
+                )
+                for file_type, parse_result in parsed_files
+            ]
+            for future in as_completed(futures):
+                target_file = future.result()
+                progress.update(
+                    main_task,
+                    description=f"Translated {target_file.relative_to(target_path)}",
+                )
                 progress.advance(main_task)
 
     console.print(f"\n[green]✓[/green] Translation complete!")
     console.print(f"Translated files saved to: {target_path}")
 
 
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard-link src to dst, falling back to a copy across filesystems."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _translate_file(
+    parser: "Parser",
+    translator: "OpenAITranslator",
+    parse_result: "ParseResult",
+    file_type: str,
+    target_lang: str,
+) -> Path:
+    """Translate the comments and text blocks of a single parsed file in place."""
+    target_file = parse_result.file_path
+    content = parse_result.raw_content
+
+    comment_texts = (
+        [c.text for c in parse_result.comments] if parser.translates_comments else []
+    )
+    block_indices = [i for i, b in enumerate(parse_result.text_blocks) if not b.is_code]
+    comment_map: dict[int, str] = {}
+    block_map: dict[int, str] = {}
+    if comment_texts:
+        translated_comments = translator.translate_file_comments(
+            comment_texts, target_lang, file_type
+        )
+        comment_map = dict(enumerate(translated_comments))
+    if block_indices:
+        translated_blocks = translator.translate_markdown_blocks(
+            [parse_result.text_blocks[i].text for i in block_indices], target_lang
+        )
+        block_map = dict(zip(block_indices, translated_blocks))
+    # Files with nothing to translate keep their (hard-linked) copy untouched
+    if comment_map or block_map:
+        content = parser.inject_all(content, comment_map, block_map, parse_result)
+        parser.write_file(target_file, content)
+
+    return target_file
+
+
 config_app = typer.Typer(help="Configuration management")
 app.add_typer(config_app, name="config")
 
@@ -242,18 +324,19 @@ def config_main(
         return
 
     if list_all:
-        providers = list_providers()
-        if not providers:
+        provider_configs = get_all_provider_configs()
+        if not provider_configs:
             console.print("[yellow]No provider configurations stored[/yellow]")
             console.print(f"\nConfig file location: {GLOBAL_CONFIG_FILE}")
         else:
+            from rich.table import Table
+
             table = Table(title="Stored Provider Configurations")
             table.add_column("Provider")
             table.add_column("API Key")
             table.add_column("Base URL")
             table.add_column("Model")
-            for p in providers:
-                cfg = get_provider_config(p)
+            for p, cfg in provider_configs.items():
                 key = "✓" if cfg.get("api_key") else "✗"
                 url = cfg.get("base_url", "-") or "-"
                 mdl = cfg.get("model", "-") or "-"
@@ -354,6 +437,8 @@ def config_path():
 
 @app.command("providers")
 def list_providers_cmd():
+    from .translator.openai import PROVIDER_BASE_URLS, PROVIDER_MODELS
+
     console.print("\n[bold]Supported LLM Providers:[/bold]\n")
     for provider, name in PROVIDER_NAMES.items():
         default_url = PROVIDER_BASE_URLS.get(provider, "-")
@@ -8,13 +8,17 @@ Supports layered configuration with the following priority (highest to lowest):
 5. Default values
 """
 
+import functools
 import json
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, cast
 
 from rich.console import Console
 
+from . import json_io
+
 console = Console()
 
 # Config file names to search for (in order)
@@ -24,11 +28,22 @@ PROJECT_CONFIG_NAMES = [
     ".repo_translate.json",
     "repo_translate.json",
 ]
+_PROJECT_CONFIG_NAME_SET = frozenset(PROJECT_CONFIG_NAMES)
 
 # Global config location
 GLOBAL_CONFIG_DIR = Path.home() / ".local" / "share" / "repo_translate"
 GLOBAL_CONFIG_FILE = GLOBAL_CONFIG_DIR / "config.json"
 
+# Environment variables and the config keys they set
+ENV_VARS = (
+    ("REPO_TRANSLATE_API_KEY", "api_key"),
+    ("REPO_TRANSLATE_PROVIDER", "provider"),
+    ("REPO_TRANSLATE_MODEL", "model"),
+    ("REPO_TRANSLATE_BASE_URL", "base_url"),
+    ("REPO_TRANSLATE_LANG", "target_lang"),
+    ("REPO_TRANSLATE_GITHUB_TOKEN", "github_token"),
+)
+
 # Default values
 DEFAULTS = {
     "provider": "openai",
@@ -40,10 +55,14 @@ DEFAULTS = {
     "push": False,
     "dry_run": False,
     "batch_size": 10,
+    "max_concurrency": 8,
+    "rpm": None,
+    "tpm": None,
+    "use_cache": True,
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class RepoTranslateConfig:
     """Configuration for repo-translate."""
 
@@ -56,6 +75,12 @@ class RepoTranslateConfig:
     push: bool = False
     dry_run: bool = False
     batch_size: int = 10
+    # API request limits: in-flight requests, requests and tokens per minute
+    max_concurrency: int = 8
+    rpm: Optional[int] = None
+    tpm: Optional[int] = None
+    # Reuse translations stored on disk by earlier runs
+    use_cache: bool = True
 
     # Source tracking (for debugging)
     _source: dict[str, str] = field(default_factory=dict)
@@ -72,9 +97,14 @@ class RepoTranslateConfig:
             "push": self.push,
             "dry_run": self.dry_run,
             "batch_size": self.batch_size,
+            "max_concurrency": self.max_concurrency,
+            "rpm": self.rpm,
+            "tpm": self.tpm,
+            "use_cache": self.use_cache,
         }
 
 
+@functools.lru_cache(maxsize=32)
 def _find_project_config(start_dir: Optional[Path] = None) -> Optional[Path]:
     """Find project config file by searching current and parent directories.
 
@@ -91,10 +121,15 @@ def _find_project_config(start_dir: Optional[Path] = None) -> Optional[Path]:
 
     # Search current directory and parent directories
     while True:
+        # One directory read per level instead of a stat() per candidate name
+        try:
+            with os.scandir(current) as it:
+                found = {e.name for e in it if e.name in _PROJECT_CONFIG_NAME_SET}
+        except OSError:
+            found = set()
         for name in PROJECT_CONFIG_NAMES:
-            config_path = current / name
-            if config_path.exists():
-                return config_path
+            if name in found:
+                return current / name
 
         # Stop at home directory or root
         if current == current.parent or current == Path.home():
@@ -116,8 +151,7 @@ def _load_json_file(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
+        return cast(dict[str, Any], json_io.loads(path.read_bytes()))
     except (json.JSONDecodeError, OSError) as e:
         console.print(f"[yellow]![/yellow] Failed to load config {path}: {e}")
         return {}
@@ -136,6 +170,20 @@ def _merge_configs(*configs: dict[str, Any]) -> dict[str, Any]:
     return result
 
 
+def _positive_int(key: str, value: Any, default: Optional[int]) -> Optional[int]:
+    """Coerce a config value to a positive int, warning and using default otherwise."""
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        number = 0
+    if isinstance(value, bool) or number < 1:
+        console.print(f"[yellow]![/yellow] Ignoring invalid {key}={value!r}; expected an integer >= 1")
+        return default
+    return number
+
+
 def load_config(
     project_dir: Optional[Path] = None,
     cli_args: Optional[dict[str, Any]] = None,
@@ -156,21 +204,22 @@ def load_config(
     Returns:
         Merged RepoTranslateConfig
     """
-    import os
+    frozen_args = frozenset(cli_args.items()) if cli_args else None
+    return _load_config_cached(project_dir, frozen_args)
+
 
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(
+    project_dir: Optional[Path],
+    cli_args: Optional[frozenset[tuple[str, Any]]],
+) -> RepoTranslateConfig:
+    """Load configuration; memoized for the lifetime of the process."""
     # 1. Default values
     defaults = DEFAULTS.copy()
 
     # 2. Environment variables
-    env_config = {
-        "api_key": os.environ.get("REPO_TRANSLATE_API_KEY"),
-        "provider": os.environ.get("REPO_TRANSLATE_PROVIDER"),
-        "model": os.environ.get("REPO_TRANSLATE_MODEL"),
-        "base_url": os.environ.get("REPO_TRANSLATE_BASE_URL"),
-        "target_lang": os.environ.get("REPO_TRANSLATE_LANG"),
-        "github_token": os.environ.get("REPO_TRANSLATE_GITHUB_TOKEN"),
-    }
-    env_config = {k: v for k, v in env_config.items() if v is not None}
+    env = os.environ
+    env_config = {key: env[var] for var, key in ENV_VARS if var in env}
 
     # 3. Global user config
     global_config = _load_json_file(GLOBAL_CONFIG_FILE)
@@ -185,7 +234,7 @@ def load_config(
     # 5. CLI arguments (filter out None values)
     cli_config = {}
     if cli_args:
-        cli_config = {k: v for k, v in cli_args.items() if v is not None}
+        cli_config = {k: v for k, v in cli_args if v is not None}
 
     # Merge all configs (priority: CLI > project > global > env > defaults)
     merged = _merge_configs(defaults, env_config, global_config, project_config, cli_config)
@@ -214,6 +263,10 @@ def load_config(
         push=merged.get("push", DEFAULTS["push"]),
         dry_run=merged.get("dry_run", DEFAULTS["dry_run"]),
         batch_size=merged.get("batch_size", DEFAULTS["batch_size"]),
+        max_concurrency=_positive_int("max_concurrency", merged.get("max_concurrency"), 8) or 8,
+        rpm=_positive_int("rpm", merged.get("rpm"), None),
+        tpm=_positive_int("tpm", merged.get("tpm"), None),
+        use_cache=bool(merged.get("use_cache", DEFAULTS["use_cache"])),
         _source=source,
     )
 
@@ -227,8 +280,9 @@ def save_global_config(config: dict[str, Any]) -> None:
         config: Configuration dictionary to save
     """
     GLOBAL_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    with open(GLOBAL_CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2)
+    with open(GLOBAL_CONFIG_FILE, "wb") as f:
+        f.write(json_io.dumps_indented(config))
+    _load_config_cached.cache_clear()
     console.print(f"[green]✓[/green] Saved global config to {GLOBAL_CONFIG_FILE}")
 
 
@@ -254,8 +308,10 @@ def create_project_config(path: Optional[Path] = None) -> Path:
         "_comment": "Remove null values and set your preferences. API key can be set here or via environment variable.",
     }
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(sample_config, f, indent=2)
+    with open(path, "wb") as f:
+        f.write(json_io.dumps_indented(sample_config))
+    _find_project_config.cache_clear()
+    _load_config_cached.cache_clear()
 
     console.print(f"[green]✓[/green] Created config template at {path}")
     return path
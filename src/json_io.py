@@ -0,0 +1,38 @@
+"""JSON helpers for config and auth files.
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON from raw file bytes.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON (orjson's error subclasses it)
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_indented(obj: Any) -> bytes:
+    """Serialize to UTF-8 encoded JSON with 2-space indentation.
+
+    Non-ASCII text is written as-is with either backend, so files come out
+    byte-identical whether or not orjson is installed.
+    """
+    if HAS_ORJSON:
+        data: bytes = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        return data
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
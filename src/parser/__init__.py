@@ -1,13 +1,9 @@
 """Parser module for extracting translatable content from various file types."""
 
-from .base import Comment, TextBlock, Parser, ParseResult
-from .markdown import MarkdownParser
-from .python import PythonParser
-from .javascript import JavaScriptParser
-from .typescript import TypeScriptParser
-from .c_cpp import CCppParser
-from .rust import RustParser
-from .swift import SwiftParser
+import functools
+import importlib
+
+from .base import Comment, TextBlock, Parser, ParseResult, parse_all, read_files
 
 __all__ = [
     "Comment",
@@ -22,21 +18,45 @@ __all__ = [
     "RustParser",
     "SwiftParser",
     "get_parser",
+    "parse_all",
+    "read_files",
 ]
 
+# Parser classes are imported on first use so that loading one file type
+# doesn't pull in every tree-sitter grammar.
 _PARSERS = {
-    "markdown": MarkdownParser,
-    "python": PythonParser,
-    "javascript": JavaScriptParser,
-    "typescript": TypeScriptParser,
-    "c": CCppParser,
-    "cpp": CCppParser,
-    "rust": RustParser,
-    "swift": SwiftParser,
+    "markdown": ".markdown:MarkdownParser",
+    "python": ".python:PythonParser",
+    "javascript": ".javascript:JavaScriptParser",
+    "typescript": ".typescript:TypeScriptParser",
+    "c": ".c_cpp:CCppParser",
+    "cpp": ".c_cpp:CCppParser",
+    "rust": ".rust:RustParser",
+    "swift": ".swift:SwiftParser",
 }
 
+_PARSER_CLASSES = {spec.rpartition(":")[2]: spec for spec in _PARSERS.values()}
+
+_loaded: dict[str, type[Parser]] = {}
+
+
+def _load_class(spec: str) -> type[Parser]:
+    cls = _loaded.get(spec)
+    if cls is None:
+        module_name, _, class_name = spec.partition(":")
+        module = importlib.import_module(module_name, __name__)
+        cls = _loaded[spec] = getattr(module, class_name)
+    return cls
+
+
+def __getattr__(name: str):
+    if name in _PARSER_CLASSES:
+        return _load_class(_PARSER_CLASSES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
+@functools.lru_cache(maxsize=None)
 def get_parser(file_type: str) -> Parser:
     if file_type not in _PARSERS:
         raise ValueError(f"Unsupported file type: {file_type}")
-    return _PARSERS[file_type]()
+    return _load_class(_PARSERS[file_type])()
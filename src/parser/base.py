@@ -1,10 +1,72 @@
 """Base parser classes and types."""
 
+import os
+import re
+import stat
 from abc import ABC, abstractmethod
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import AnyStr, Optional
+
+_NEWLINE_RE = re.compile("\n")
+
+
+def build_line_index(content: str) -> array:
+    """Compute the start offset of each line without splitting the content.
+
+    Args:
+        content: File content
+
+    Returns:
+        Array whose entry i is the offset where 0-indexed line i starts
+    """
+    index = array("q", [0])
+    index.extend(m.end() for m in _NEWLINE_RE.finditer(content))
+    return index
+
+
+def line_span(content: str, index: array, line: int) -> tuple[int, int]:
+    """Get the (start, end) offsets of a 0-indexed line, excluding its newline.
+
+    Args:
+        content: File content
+        index: Line index from build_line_index()
+        line: 0-indexed line number
+
+    Returns:
+        Tuple of (start, end) offsets
+    """
+    end = index[line + 1] - 1 if line + 1 < len(index) else len(content)
+    return index[line], end
+
+
+def splice_ranges(content: AnyStr, edits: list[tuple[int, int, AnyStr]]) -> AnyStr:
+    """Replace ranges of content in a single pass.
+
+    Works on text with character offsets or on encoded bytes with byte offsets.
+
+    Args:
+        content: Original text or bytes
+        edits: (start, end, replacement) tuples; an edit overlapping one that
+            starts earlier (or is listed first) is skipped
+
+    Returns:
+        Content with all replacements applied
+    """
+    pieces = []
+    pos = 0
+    # Callers usually pass edits in order, which sorted() checks in one pass
+    for start, end, replacement in sorted(edits, key=lambda e: e[0]):
+        if start < pos:
+            continue
+        pieces.append(content[pos:start])
+        pieces.append(replacement)
+        pos = end
+    pieces.append(content[pos:])
+    return content[:0].join(pieces)
 
 
 class CommentType(Enum):
@@ -17,7 +79,13 @@ class CommentType(Enum):
     DOC_COMMENT = "doc"  # /// Rust doc comments
 
 
-@dataclass
+# Comment.subtype values for doc comments
+DOC_BLOCK = 0  # /** ... */
+DOC_LINE = 1  # /// ...
+DOC_BANG = 2  # /*! ... */
+
+
+@dataclass(slots=True)
 class Comment:
     """Represents a code comment."""
 
@@ -28,13 +96,16 @@ class Comment:
     column_start: int = 0
     column_end: int = 0
     original: str = ""  # Original text including comment markers
+    start_byte: int = 0  # UTF-8 byte range in the source (tree-sitter parsers)
+    end_byte: int = 0
+    subtype: int = DOC_BLOCK  # Doc comment flavor, set by parsers that distinguish them
 
     def __post_init__(self):
         if not self.original:
             self.original = self.text
 
 
-@dataclass
+@dataclass(slots=True)
 class TextBlock:
     """Represents a block of translatable text (e.g., in markdown)."""
 
@@ -50,7 +121,7 @@ class TextBlock:
             self.original = self.text
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseResult:
     """Result of parsing a file."""
 
@@ -63,6 +134,13 @@ class ParseResult:
 class Parser(ABC):
     """Abstract base class for file parsers."""
 
+    # Parsers that run pure-Python code hold the GIL while parsing, so
+    # parse_all() sends their files to worker processes instead of threads.
+    parse_in_process: bool = False
+    # Whether inject_all() applies comment translations; when False the
+    # comments are not sent for translation at all.
+    translates_comments: bool = True
+
     @property
     @abstractmethod
     def file_extensions(self) -> set[str]:
@@ -101,6 +179,28 @@ class Parser(ABC):
         """
         pass
 
+    def inject_all(
+        self,
+        content: str,
+        comment_translations: dict[int, str],
+        block_translations: dict[int, str],
+        parse_result: ParseResult,
+    ) -> str:
+        """Inject comment and text block translations in a single pass.
+
+        The default implementation handles parsers that only extract comments.
+
+        Args:
+            content: Original file content
+            comment_translations: Dictionary mapping comment index to translated text
+            block_translations: Dictionary mapping text block index to translated text
+            parse_result: Original parse result with element positions
+
+        Returns:
+            Content with translations injected
+        """
+        return self.inject_translations(content, comment_translations, parse_result)
+
     def read_file(self, file_path: Path) -> str:
         """Read file content.
 
@@ -110,7 +210,7 @@ class Parser(ABC):
         Returns:
             File content as string
         """
-        return file_path.read_text(encoding="utf-8", errors="replace")
+        return decode_source(file_path.read_bytes())
 
     def write_file(self, file_path: Path, content: str) -> None:
         """Write content to file.
@@ -119,4 +219,107 @@ class Parser(ABC):
             file_path: Path to file
             content: Content to write
         """
-        file_path.write_text(content, encoding="utf-8")
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
+            st = None
+        if st is not None and st.st_nlink > 1:
+            # Hard-linked to the cloned source: replace the link instead of writing through it
+            file_path.unlink()
+            file_path.write_text(content, encoding="utf-8")
+            os.chmod(file_path, stat.S_IMODE(st.st_mode))
+        else:
+            file_path.write_text(content, encoding="utf-8")
+
+
+def decode_source(data: bytes) -> str:
+    """Decode file bytes as UTF-8 with universal newlines, like Path.read_text."""
+    text = data.decode("utf-8", "replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def read_files(paths: list[Path], max_workers: Optional[int] = None) -> dict[Path, str]:
+    """Read many files concurrently.
+
+    Reads run on a thread pool (the GIL is released during the read);
+    decoding happens on the calling thread.
+
+    Args:
+        paths: Files to read
+        max_workers: Number of reader threads (default: executor default)
+
+    Returns:
+        Dictionary mapping each path to its content; files that can't be read
+        are left out
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        data = list(executor.map(_read_bytes, paths))
+    return {path: decode_source(raw) for path, raw in zip(paths, data) if raw is not None}
+
+
+def _read_bytes(path: Path) -> Optional[bytes]:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _read_and_parse(parser: Parser, file_path: Path) -> Optional[ParseResult]:
+    try:
+        content = parser.read_file(file_path)
+    except OSError:
+        return None
+    return parser.parse(content, file_path)
+
+
+def parse_all(
+    files: list[tuple[Path, str]],
+    parser_map: dict[str, Parser],
+    max_workers: Optional[int] = None,
+) -> list[Optional[ParseResult]]:
+    """Read and parse many files concurrently.
+
+    Files go to a thread pool, read up front with read_files(), except those
+    whose parser sets ``parse_in_process``, which are read and parsed in a
+    process pool.
+
+    Every result keeps its file's content (raw_content), so the whole batch is
+    in memory at once; callers with very large trees can pass the files in
+    chunks.
+
+    Args:
+        files: (file path, file type) pairs
+        parser_map: Parser for each file type
+        max_workers: Worker count per pool (default: executor default)
+
+    Returns:
+        Parse results in the same order as files, with None for a file that
+        couldn't be read
+    """
+    in_process = [i for i, (_, ft) in enumerate(files) if parser_map[ft].parse_in_process]
+    in_thread = [i for i, (_, ft) in enumerate(files) if not parser_map[ft].parse_in_process]
+    results: list[Optional[ParseResult]] = [None] * len(files)
+
+    if in_thread:
+        paths = [files[i][0] for i in in_thread]
+        contents = read_files(paths, max_workers)
+        parsers = [parser_map[files[i][1]] for i in in_thread]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            parsed = executor.map(
+                lambda parser, path: (
+                    parser.parse(contents[path], path) if path in contents else None
+                ),
+                parsers,
+                paths,
+            )
+            for i, result in zip(in_thread, parsed):
+                results[i] = result
+    if in_process:
+        paths = [files[i][0] for i in in_process]
+        parsers = [parser_map[files[i][1]] for i in in_process]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for i, result in zip(in_process, executor.map(_read_and_parse, parsers, paths)):
+                results[i] = result
+    return results
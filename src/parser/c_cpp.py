@@ -1,12 +1,34 @@
 """C/C++ parser using tree-sitter."""
 
+import threading
+
 import tree_sitter_c as tsc
 from pathlib import Path
 from typing import Optional
 
 from tree_sitter import Language, Parser as TSParser
 
-from .base import Comment, CommentType, Parser, ParseResult
+from .base import (
+    DOC_BANG,
+    DOC_BLOCK,
+    DOC_LINE,
+    Comment,
+    CommentType,
+    Parser,
+    ParseResult,
+    splice_ranges,
+)
+
+
+# Shared grammar, created on first use; tree-sitter parsers are not thread-safe,
+# so each thread gets its own parser.
+_LANGUAGE: Optional[Language] = None
+_local = threading.local()
+
+# Node types that cannot contain comments; the walk doesn't descend into them
+_NO_COMMENT_NODES = frozenset(
+    {"string_literal", "char_literal", "raw_string_literal", "system_lib_string"}
+)
 
 
 class CCppParser(Parser):
@@ -17,48 +39,80 @@ class CCppParser(Parser):
         return {".c", ".h", ".cpp", ".cxx", ".cc", ".hpp", ".hxx", ".hh"}
 
     def _get_language(self) -> Language:
-        return Language(tsc.language())
+        global _LANGUAGE
+        if _LANGUAGE is None:
+            _LANGUAGE = Language(tsc.language())
+        return _LANGUAGE
+
+    def _get_ts_parser(self) -> TSParser:
+        parser = getattr(_local, "parser", None)
+        if parser is None:
+            parser = _local.parser = TSParser(self._get_language())
+        return parser
 
     def parse(self, content: str, file_path: Optional[Path] = None) -> ParseResult:
         result = ParseResult(
             file_path=file_path or Path(""),
             raw_content=content,
         )
+        # Every comment starts with one of these; skip tree-sitter when neither occurs
+        if "//" not in content and "/*" not in content:
+            return result
         try:
-            language = self._get_language()
-            parser = TSParser(language)
-            tree = parser.parse(bytes(content, "utf-8"))
-            self._extract_comments(tree.root_node, result)
+            content_bytes = content.encode("utf-8")
+            tree = self._get_ts_parser().parse(content_bytes)
+            self._extract_comments(tree.root_node, content_bytes, result)
         except Exception:
             pass
         result.comments.sort(key=lambda c: c.line_start)
         return result
 
-    def _extract_comments(self, node, result: ParseResult) -> None:
-        if node.type == "comment":
-            comment_text = node.text.decode("utf-8")
-            if comment_text.startswith("/**") or comment_text.startswith("/*!"):
-                comment_type = CommentType.DOC_COMMENT
-            elif comment_text.startswith("///"):
-                comment_type = CommentType.DOC_COMMENT
-            elif comment_text.startswith("/*"):
-                comment_type = CommentType.MULTI_LINE
-            else:
-                comment_type = CommentType.SINGLE_LINE
-            clean_text = self._clean_comment_text(comment_text, comment_type)
-            result.comments.append(
-                Comment(
-                    text=clean_text,
-                    type=comment_type,
-                    line_start=node.start_point[0] + 1,
-                    line_end=node.end_point[0] + 1,
-                    column_start=node.start_point[1],
-                    column_end=node.end_point[1],
-                    original=comment_text,
-                )
+    def _extract_comments(self, node, content_bytes: bytes, result: ParseResult) -> None:
+        # Iterative pre-order walk with a tree cursor: no Python recursion and
+        # no per-node children lists.
+        cursor = node.walk()
+        while True:
+            current = cursor.node
+            if current.type == "comment":
+                self._add_comment(current, content_bytes, result)
+            elif current.type not in _NO_COMMENT_NODES and cursor.goto_first_child():
+                continue
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return
+
+    def _add_comment(self, node, content_bytes: bytes, result: ParseResult) -> None:
+        start_byte = node.start_byte
+        end_byte = node.end_byte
+        comment_text = content_bytes[start_byte:end_byte].decode("utf-8", "replace")
+        subtype = DOC_BLOCK
+        if comment_text.startswith("/**"):
+            comment_type = CommentType.DOC_COMMENT
+        elif comment_text.startswith("/*!"):
+            comment_type = CommentType.DOC_COMMENT
+            subtype = DOC_BANG
+        elif comment_text.startswith("///"):
+            comment_type = CommentType.DOC_COMMENT
+            subtype = DOC_LINE
+        elif comment_text.startswith("/*"):
+            comment_type = CommentType.MULTI_LINE
+        else:
+            comment_type = CommentType.SINGLE_LINE
+        clean_text = self._clean_comment_text(comment_text, comment_type)
+        result.comments.append(
+            Comment(
+                text=clean_text,
+                type=comment_type,
+                line_start=node.start_point[0] + 1,
+                line_end=node.end_point[0] + 1,
+                column_start=node.start_point[1],
+                column_end=node.end_point[1],
+                original=comment_text,
+                start_byte=start_byte,
+                end_byte=end_byte,
+                subtype=subtype,
             )
-        for child in node.children:
-            self._extract_comments(child, result)
+        )
 
     def _clean_comment_text(self, comment: str, comment_type: CommentType) -> str:
         if comment_type == CommentType.SINGLE_LINE:
@@ -91,56 +145,45 @@ class CCppParser(Parser):
         translations: dict[int, str],
         parse_result: ParseResult,
     ) -> str:
-        lines = content.split("\n")
-        for idx in sorted(translations.keys(), reverse=True):
-            if idx >= len(parse_result.comments):
+        # Comments carry their byte range, so each one is replaced in place
+        data = content.encode("utf-8")
+        edits = []
+        for idx, comment in enumerate(parse_result.comments):
+            translated = translations.get(idx)
+            if translated is None:
                 continue
-            comment = parse_result.comments[idx]
-            translated = translations[idx]
-            start_line = comment.line_start - 1
-            end_line = comment.line_end - 1
+            # Leading whitespace of the comment's first line, used for continuation lines
+            line_start = data.rfind(b"\n", 0, comment.start_byte) + 1
+            prefix = data[line_start : comment.start_byte]
+            indent = prefix[: len(prefix) - len(prefix.lstrip(b" \t"))].decode("utf-8")
             if comment.type == CommentType.SINGLE_LINE:
-                original_line = lines[start_line]
-                slash_pos = original_line.find("//")
-                indent = original_line[:slash_pos]
-                lines[start_line] = f"{indent}// {translated}"
+                new_lines = [f"{indent}// {translated}"]
             elif comment.type == CommentType.DOC_COMMENT:
-                original_first = lines[start_line]
-                indent = ""
-                for char in original_first:
-                    if char in " \t":
-                        indent += char
-                    else:
-                        break
-                if comment.original.startswith("///"):
+                if comment.subtype == DOC_LINE:
                     trans_lines = translated.split("\n")
                     new_lines = [f"{indent}/// {line}" for line in trans_lines]
-                    lines[start_line : end_line + 1] = new_lines
                 else:
+                    opener = "/*!" if comment.subtype == DOC_BANG else "/**"
                     trans_lines = translated.split("\n")
                     if len(trans_lines) == 1:
-                        lines[start_line] = f"{indent}/** {translated} */"
+                        new_lines = [f"{indent}{opener} {translated} */"]
                     else:
-                        new_lines = [f"{indent}/**"]
+                        new_lines = [f"{indent}{opener}"]
                         for trans_line in trans_lines:
                             new_lines.append(f"{indent} * {trans_line}")
                         new_lines.append(f"{indent} */")
-                        lines[start_line : end_line + 1] = new_lines
             elif comment.type == CommentType.MULTI_LINE:
-                original_first = lines[start_line]
-                indent = ""
-                for char in original_first:
-                    if char in " \t":
-                        indent += char
-                    else:
-                        break
                 trans_lines = translated.split("\n")
                 if len(trans_lines) == 1:
-                    lines[start_line] = f"{indent}/* {translated} */"
+                    new_lines = [f"{indent}/* {translated} */"]
                 else:
                     new_lines = [f"{indent}/*"]
                     for trans_line in trans_lines:
                         new_lines.append(f"{indent}   {trans_line}")
                     new_lines.append(f"{indent} */")
-                    lines[start_line : end_line + 1] = new_lines
-        return "\n".join(lines)
+            else:
+                continue
+            # Whatever precedes the comment on its first line is kept as-is
+            replacement = "\n".join(new_lines)[len(indent) :]
+            edits.append((comment.start_byte, comment.end_byte, replacement.encode("utf-8")))
+        return splice_ranges(data, edits).decode("utf-8")
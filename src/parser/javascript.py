@@ -96,12 +96,12 @@ class JavaScriptParser(Parser):
     ) -> str:
         lines = content.split("\n")
 
-        for idx in sorted(translations.keys(), reverse=True):
-            if idx >= len(parse_result.comments):
+        # Walk bottom-up (comments are in line order) so earlier line numbers stay valid
+        for idx in range(len(parse_result.comments) - 1, -1, -1):
+            translated = translations.get(idx)
+            if translated is None:
                 continue
-
             comment = parse_result.comments[idx]
-            translated = translations[idx]
 
             start_line = comment.line_start - 1
             end_line = comment.line_end - 1
@@ -117,12 +117,8 @@ class JavaScriptParser(Parser):
                 start_marker = "/**" if is_jsdoc else "/*"
 
                 original_first = lines[start_line]
-                indent = ""
-                for char in original_first:
-                    if char in " \t":
-                        indent += char
-                    else:
-                        break
+                stripped = original_first.lstrip(" \t")
+                indent = original_first[: len(original_first) - len(stripped)]
 
                 trans_lines = translated.split("\n")
                 if len(trans_lines) == 1:
@@ -4,12 +4,29 @@ import re
 from pathlib import Path
 from typing import Optional
 
-from .base import Comment, CommentType, Parser, ParseResult, TextBlock
+from .base import (
+    Comment,
+    CommentType,
+    Parser,
+    ParseResult,
+    TextBlock,
+    build_line_index,
+    line_span,
+    splice_ranges,
+)
+
+# Code fences at the start of any line
+_FENCE_RE = re.compile(r"^```(\w*)", re.MULTILINE)
+# HTML comments; "." stops at newlines, so a comment is matched within one line
+_HTML_COMMENT_RE = re.compile(r"<!--(.+?)-->")
 
 
 class MarkdownParser(Parser):
     """Parser for Markdown files."""
 
+    # HTML comments are translated as part of their text blocks
+    translates_comments = False
+
     @property
     def file_extensions(self) -> set[str]:
         return {".md", ".markdown", ".mdown", ".mkd"}
@@ -23,85 +40,111 @@ class MarkdownParser(Parser):
         - URLs and links (URLs preserved, link text translated)
         - Headers, paragraphs, lists (translated)
         """
-        lines = content.split("\n")
         result = ParseResult(
             file_path=file_path or Path(""),
             raw_content=content,
         )
 
+        # Everything between two fences is one segment: alternately text and code.
+        # Fences and comments are found with regex sweeps over the whole content.
         in_code_block = False
         code_lang = ""
-        current_block_lines: list[str] = []
-        block_start = 0
-
-        for i, line in enumerate(lines, 1):
-            # Check for code block boundaries
-            code_match = re.match(r"^```(\w*)", line)
-            if code_match:
-                if in_code_block:
-                    # End of code block
-                    if current_block_lines:
-                        result.text_blocks.append(
-                            TextBlock(
-                                text="\n".join(current_block_lines),
-                                line_start=block_start,
-                                line_end=i - 1,
-                                is_code=True,
-                                code_language=code_lang,
-                            )
-                        )
-                        current_block_lines = []
-                    in_code_block = False
-                else:
-                    # Start of code block - flush any pending text block
-                    if current_block_lines:
-                        result.text_blocks.append(
-                            TextBlock(
-                                text="\n".join(current_block_lines),
-                                line_start=block_start,
-                                line_end=i - 1,
-                                is_code=False,
-                            )
-                        )
-                        current_block_lines = []
-                    in_code_block = True
-                    code_lang = code_match.group(1) or ""
-                    block_start = i
-                continue
+        code_start = 0  # Line of the opening fence
+        seg_line = 1  # First line of the current segment
+        seg_offset = 0  # Offset of that line in content
+        line_no = 1
+        last_pos = 0
+
+        for fence in _FENCE_RE.finditer(content):
+            fence_pos = fence.start()
+            line_no += content.count("\n", last_pos, fence_pos)
+            last_pos = fence_pos
+
+            if line_no > seg_line:
+                # Segment text excludes the newline before the fence
+                self._add_segment(
+                    result,
+                    content[seg_offset : fence_pos - 1],
+                    seg_line,
+                    line_no - 1,
+                    in_code_block,
+                    code_start,
+                    code_lang,
+                )
 
             if in_code_block:
-                current_block_lines.append(line)
+                in_code_block = False
             else:
-                # Extract HTML comments
-                html_comments = re.findall(r"<!--(.+?)-->", line, re.DOTALL)
-                for comment_text in html_comments:
-                    result.comments.append(
-                        Comment(
-                            text=comment_text.strip(),
-                            type=CommentType.MULTI_LINE,
-                            line_start=i,
-                            line_end=i,
-                        )
-                    )
-
-                # Process text, preserving inline code
-                if not current_block_lines:
-                    block_start = i
-                current_block_lines.append(line)
+                in_code_block = True
+                code_lang = fence.group(1) or ""
+                code_start = line_no
+
+            line_end_pos = content.find("\n", fence.end())
+            if line_end_pos == -1:
+                return result  # Fence on the last line; nothing follows
+            seg_line = line_no + 1
+            seg_offset = line_end_pos + 1
 
         # Handle remaining block
-        if current_block_lines:
+        total_lines = line_no + content.count("\n", last_pos)
+        self._add_segment(
+            result,
+            content[seg_offset:],
+            seg_line,
+            total_lines,
+            in_code_block,
+            code_start,
+            code_lang,
+        )
+
+        return result
+
+    def _add_segment(
+        self,
+        result: ParseResult,
+        text: str,
+        line_start: int,
+        line_end: int,
+        is_code: bool,
+        code_start: int,
+        code_lang: str,
+    ) -> None:
+        """Append the text or code block for lines line_start..line_end."""
+        if is_code:
             result.text_blocks.append(
                 TextBlock(
-                    text="\n".join(current_block_lines),
-                    line_start=block_start,
-                    line_end=len(lines),
-                    is_code=in_code_block,
-                    code_language=code_lang if in_code_block else "",
+                    text=text,
+                    line_start=code_start,
+                    line_end=line_end,
+                    is_code=True,
+                    code_language=code_lang,
+                )
+            )
+            return
+
+        # Extract HTML comments
+        line_no = line_start
+        last_pos = 0
+        for match in _HTML_COMMENT_RE.finditer(text):
+            line_no += text.count("\n", last_pos, match.start())
+            last_pos = match.start()
+            result.comments.append(
+                Comment(
+                    text=match.group(1).strip(),
+                    type=CommentType.MULTI_LINE,
+                    line_start=line_no,
+                    line_end=line_no,
                 )
             )
 
-        return result
+        result.text_blocks.append(
+            TextBlock(
+                text=text,
+                line_start=line_start,
+                line_end=line_end,
+                is_code=False,
+            )
+        )
 
     def inject_translations(
         self,
@@ -114,27 +157,34 @@ class MarkdownParser(Parser):
         This replaces entire text blocks with their translations.
         For markdown, we need to be careful to preserve structure.
         """
-        lines = content.split("\n")
+        index = build_line_index(content)
+        edits = []
 
-        # Process text blocks in reverse order to avoid offset issues
-        for idx in sorted(translations.keys(), reverse=True):
-            if idx >= len(parse_result.text_blocks):
-                continue
-
-            block = parse_result.text_blocks[idx]
-            if block.is_code:
+        for idx, block in enumerate(parse_result.text_blocks):
+            translated = translations.get(idx)
+            if translated is None or block.is_code:
                 continue  # Don't modify code blocks
 
-            translated_text = translations[idx]
+            # Replace the block's lines (line numbers are 1-indexed)
+            start = index[block.line_start - 1]
+            _, end = line_span(content, index, block.line_end - 1)
+            edits.append((start, end, translated))
 
-            # Replace the lines
-            start = block.line_start - 1  # Convert to 0-indexed
-            end = block.line_end
-            new_lines = translated_text.split("\n")
+        return splice_ranges(content, edits)
 
-            lines[start:end] = new_lines
+    def inject_all(
+        self,
+        content: str,
+        comment_translations: dict[int, str],
+        block_translations: dict[int, str],
+        parse_result: ParseResult,
+    ) -> str:
+        """Inject translations into markdown content.
 
-        return "\n".join(lines)
+        HTML comments live inside text blocks, so replacing the blocks already
+        carries them over; comment translations are not applied separately.
+        """
+        return self.inject_translations(content, block_translations, parse_result)
 
     def extract_plain_text(self, block: TextBlock) -> str:
         """Extract plain text from a markdown block, preserving structure.
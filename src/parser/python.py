@@ -1,6 +1,8 @@
 """Python parser using ast-comments to preserve comments."""
 
 import ast
+import inspect
+from array import array
 from pathlib import Path
 from typing import Optional
 
@@ -12,22 +14,54 @@ except ImportError:
     HAS_AST_COMMENTS = False
     astc = None
 
-from .base import Comment, CommentType, Parser, ParseResult
+from .base import (
+    Comment,
+    CommentType,
+    Parser,
+    ParseResult,
+    build_line_index,
+    line_span,
+    splice_ranges,
+)
 
 
 class _CommentNode:
     """Helper to detect Comment nodes from ast-comments."""
 
-    pass
+    # Attributes of astc.Comment used by the parser
+    value: str
+    lineno: int
+    col_offset: int
 
 
 if HAS_AST_COMMENTS and hasattr(astc, "Comment"):
     _CommentNode = astc.Comment
 
+_DOCSTRING_OWNERS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Module)
+
+
+def _docstring_node(node: ast.AST) -> Optional[ast.Constant]:
+    """Get the string constant holding a node's docstring, if it has one.
+
+    Same rules as ast.get_docstring(), checked in one pass.
+    """
+    if not isinstance(node, _DOCSTRING_OWNERS) or not node.body:
+        return None
+    first = node.body[0]
+    if (
+        isinstance(first, ast.Expr)
+        and isinstance(first.value, ast.Constant)
+        and isinstance(first.value.value, str)
+    ):
+        return first.value
+    return None
+
 
 class PythonParser(Parser):
     """Parser for Python files using ast-comments."""
 
+    parse_in_process = True
+
     @property
     def file_extensions(self) -> set[str]:
         return {".py", ".pyw"}
@@ -38,6 +72,10 @@ class PythonParser(Parser):
             raw_content=content,
         )
 
+        # Comments need "#" and docstrings need a quote; skip parsing otherwise
+        if "#" not in content and '"' not in content and "'" not in content:
+            return result
+
         if not HAS_AST_COMMENTS:
             return self._parse_standard(content, result)
 
@@ -46,15 +84,15 @@ class PythonParser(Parser):
         except SyntaxError:
             return result
 
-        lines = content.split("\n")
+        index = build_line_index(content)
 
-        # New API: Comment nodes are in the AST tree
+        # Single walk collecting both comment nodes (ast-comments) and docstrings
         for node in ast.walk(tree):
             # Handle Comment nodes from ast-comments
-            if HAS_AST_COMMENTS and isinstance(node, _CommentNode):
-                comment_text = node.value if hasattr(node, "value") else str(node)
-                lineno = getattr(node, "lineno", 1)
-                col_offset = getattr(node, "col_offset", 0)
+            if isinstance(node, _CommentNode):
+                comment_text = node.value
+                lineno = node.lineno
+                col_offset = node.col_offset
 
                 # Determine if it's inline (after code) or standalone
                 if col_offset > 0:
@@ -73,44 +111,43 @@ class PythonParser(Parser):
                         original=comment_text,
                     )
                 )
+                continue
 
-        # Also extract docstrings
-        for node in ast.walk(tree):
-            if not isinstance(
-                node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Module)
-            ):
+            # Also extract docstrings (cleaned like ast.get_docstring)
+            doc_node = _docstring_node(node)
+            if doc_node is None:
                 continue
-            docstring = ast.get_docstring(node)
+            value = doc_node.value
+            if not isinstance(value, str):
+                continue
+            docstring = inspect.cleandoc(value)
             if not docstring:
                 continue
-            if node.body and isinstance(node.body[0], ast.Expr):
-                if isinstance(node.body[0].value, ast.Constant):
-                    doc_node = node.body[0].value
-                    quote_style = self._detect_quote_style(content, docstring)
-                    result.comments.append(
-                        Comment(
-                            text=docstring,
-                            type=CommentType.DOCSTRING,
-                            line_start=doc_node.lineno,
-                            line_end=getattr(doc_node, "end_lineno", doc_node.lineno)
-                            or doc_node.lineno,
-                            column_start=doc_node.col_offset,
-                            column_end=getattr(doc_node, "end_col_offset", 0) or 0,
-                            original=quote_style + docstring + quote_style,
-                        )
-                    )
+            quote_style = self._detect_quote_style(content, index, doc_node)
+            end_col = doc_node.end_col_offset
+            result.comments.append(
+                Comment(
+                    text=docstring,
+                    type=CommentType.DOCSTRING,
+                    line_start=doc_node.lineno,
+                    line_end=doc_node.end_lineno or doc_node.lineno,
+                    column_start=doc_node.col_offset,
+                    column_end=end_col if end_col is not None else doc_node.col_offset,
+                    original=quote_style + docstring + quote_style,
+                )
+            )
 
         result.comments.sort(key=lambda c: c.line_start)
         return result
 
-    def _detect_quote_style(self, content: str, docstring: str) -> str:
-        pos = content.find(docstring)
-        if pos <= 0:
-            return '"""'
-        before = content[max(0, pos - 10) : pos]
-        if '"""' in before:
-            return '"""'
-        return "'''"
+    def _detect_quote_style(self, content: str, index: array, doc_node: ast.expr) -> str:
+        # col_offset is a UTF-8 byte offset; skip any string prefix (r, u)
+        start_pos, end_pos = line_span(content, index, doc_node.lineno - 1)
+        line = content[start_pos:end_pos]
+        start = line.encode("utf-8")[doc_node.col_offset :].lstrip(b"rRuU")
+        if start.startswith(b"'''"):
+            return "'''"
+        return '"""'
 
     def _parse_standard(self, content: str, result: ParseResult) -> ParseResult:
         try:
@@ -119,24 +156,23 @@ class PythonParser(Parser):
             return result
 
         for node in ast.walk(tree):
-            if not isinstance(
-                node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Module)
-            ):
+            doc_node = _docstring_node(node)
+            if doc_node is None:
+                continue
+            value = doc_node.value
+            if not isinstance(value, str):
                 continue
-            docstring = ast.get_docstring(node)
+            docstring = inspect.cleandoc(value)
             if not docstring:
                 continue
-            if node.body and isinstance(node.body[0], ast.Expr):
-                doc_node = node.body[0].value
-                result.comments.append(
-                    Comment(
-                        text=docstring,
-                        type=CommentType.DOCSTRING,
-                        line_start=doc_node.lineno,
-                        line_end=getattr(doc_node, "end_lineno", doc_node.lineno)
-                        or doc_node.lineno,
-                    )
+            result.comments.append(
+                Comment(
+                    text=docstring,
+                    type=CommentType.DOCSTRING,
+                    line_start=doc_node.lineno,
+                    line_end=doc_node.end_lineno or doc_node.lineno,
                 )
+            )
         return result
 
     def inject_translations(
@@ -145,55 +181,46 @@ class PythonParser(Parser):
         translations: dict[int, str],
         parse_result: ParseResult,
     ) -> str:
-        lines = content.split("\n")
+        index = build_line_index(content)
+        edits = []
 
-        for idx in sorted(translations.keys(), reverse=True):
-            if idx >= len(parse_result.comments):
+        for idx, comment in enumerate(parse_result.comments):
+            translated = translations.get(idx)
+            if translated is None:
                 continue
 
-            comment = parse_result.comments[idx]
-            translated = translations[idx]
-
-            start_line = comment.line_start - 1
-            end_line = comment.line_end - 1
+            start, first_line_end = line_span(content, index, comment.line_start - 1)
+            _, end = line_span(content, index, comment.line_end - 1)
+            first_line = content[start:first_line_end]
 
             if comment.type == CommentType.SINGLE_LINE:
-                original_line = lines[start_line]
-                hash_pos = original_line.find("#")
+                hash_pos = first_line.find("#")
                 if hash_pos == -1:
                     continue
-                indent = original_line[: hash_pos + 1]
-                lines[start_line] = f"{indent} {translated}"
+                indent = first_line[: hash_pos + 1]
+                new_lines = [f"{indent} {translated}"]
 
             elif comment.type == CommentType.DOCSTRING:
                 quote = '"""' if '"""' in comment.original else "'''"
 
-                if start_line == end_line:
-                    indent = ""
-                    for char in lines[start_line]:
-                        if char in " \t":
-                            indent += char
-                        else:
-                            break
-                    lines[start_line] = f"{indent}{quote}{translated}{quote}"
+                if comment.line_start == comment.line_end:
+                    indent = first_line[: len(first_line) - len(first_line.lstrip(" \t"))]
+                    new_lines = [f"{indent}{quote}{translated}{quote}"]
                 else:
-                    original_first = lines[start_line]
-                    indent = ""
-                    for char in original_first:
-                        if char in " \t":
-                            indent += char
-                        else:
-                            break
+                    stripped = first_line.lstrip(" \t")
+                    indent = first_line[: len(first_line) - len(stripped)]
 
                     new_lines = [f"{indent}{quote}"]
                     for trans_line in translated.split("\n"):
                         new_lines.append(f"{indent}    {trans_line}")
                     new_lines.append(f"{indent}{quote}")
 
-                    lines[start_line : end_line + 1] = new_lines
-
             elif comment.type == CommentType.MULTI_LINE:
-                translated_lines = translated.split("\n")
-                lines[start_line : end_line + 1] = translated_lines
+                new_lines = translated.split("\n")
+
+            else:
+                continue
+
+            edits.append((start, end, "\n".join(new_lines)))
 
-        return "\n".join(lines)
+        return splice_ranges(content, edits)
@@ -102,11 +102,12 @@ class SwiftParser(Parser):
         parse_result: ParseResult,
     ) -> str:
         lines = content.split("\n")
-        for idx in sorted(translations.keys(), reverse=True):
-            if idx >= len(parse_result.comments):
+        # Walk bottom-up (comments are in line order) so earlier line numbers stay valid
+        for idx in range(len(parse_result.comments) - 1, -1, -1):
+            translated = translations.get(idx)
+            if translated is None:
                 continue
             comment = parse_result.comments[idx]
-            translated = translations[idx]
             start_line = comment.line_start - 1
             end_line = comment.line_end - 1
             if comment.type == CommentType.SINGLE_LINE:
@@ -116,12 +117,8 @@ class SwiftParser(Parser):
                 lines[start_line] = f"{indent}// {translated}"
             elif comment.type == CommentType.DOC_COMMENT:
                 original_first = lines[start_line]
-                indent = ""
-                for char in original_first:
-                    if char in " \t":
-                        indent += char
-                    else:
-                        break
+                stripped = original_first.lstrip(" \t")
+                indent = original_first[: len(original_first) - len(stripped)]
                 if comment.original.startswith("///"):
                     trans_lines = translated.split("\n")
                     new_lines = [f"{indent}/// {line}" for line in trans_lines]
@@ -138,12 +135,8 @@ class SwiftParser(Parser):
                         lines[start_line : end_line + 1] = new_lines
             elif comment.type == CommentType.MULTI_LINE:
                 original_first = lines[start_line]
-                indent = ""
-                for char in original_first:
-                    if char in " \t":
-                        indent += char
-                    else:
-                        break
+                stripped = original_first.lstrip(" \t")
+                indent = original_first[: len(original_first) - len(stripped)]
                 trans_lines = translated.split("\n")
                 if len(trans_lines) == 1:
                     lines[start_line] = f"{indent}/* {translated} */"
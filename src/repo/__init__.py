@@ -1,9 +1,19 @@
 """Repository operations - clone and scan."""
 
-from .clone import clone_repo, get_file_list, filter_translatable_files, parse_github_url
+from .clone import (
+    clone_repo,
+    filter_translatable_files,
+    find_translatable_files,
+    get_file_list,
+    parse_github_url,
+    scan_translatable,
+)
+
 __all__ = [
     "clone_repo",
     "get_file_list",
     "filter_translatable_files",
+    "find_translatable_files",
     "parse_github_url",
+    "scan_translatable",
 ]
@@ -5,8 +5,7 @@ import re
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Optional
-from urllib.parse import urlparse
+from typing import Any, Iterator, Optional
 
 from git import Repo
 from rich.console import Console
@@ -59,6 +58,9 @@ SKIP_PATTERNS = [
     r"\.tar\.gz$",
     r"\.rar$",
 ]
+_SKIP_RE = re.compile("|".join(f"(?:{p})" for p in SKIP_PATTERNS))
+# Directory patterns, matched against "<dir>/" so whole subtrees can be pruned
+_SKIP_DIR_RE = re.compile("|".join(f"(?:{p})" for p in SKIP_PATTERNS if p.endswith("/")))
 
 # Translatable file extensions by type
 TRANSLATABLE_EXTENSIONS = {
@@ -72,6 +74,20 @@ TRANSLATABLE_EXTENSIONS = {
     "swift": {".swift"},
     "text": {".txt", ".rst", ".adoc"},
 }
+# owner/repo, optionally behind a scheme and host, with an optional .git suffix
+# and any trailing path (e.g. /tree/main)
+_GITHUB_URL_RE = re.compile(r"^(?:https?://[^/]+/)?([^/]+)/([^/]+?)(?:\.git)?(?:/.*)?$")
+
+_EXT_TO_TYPE = {ext: t for t, exts in TRANSLATABLE_EXTENSIONS.items() for ext in exts}
+
+# Only the checked-out tree is needed: no history, other branches or tags
+CLONE_OPTIONS: dict[str, Any] = {
+    "depth": 1,
+    "single_branch": True,
+    "no_tags": True,
+}
+# Fail instead of hanging on a credential prompt for private/missing repos
+_CLONE_ENV = {"GIT_TERMINAL_PROMPT": "0"}
 
 
 def parse_github_url(url: str) -> tuple[str, str]:
@@ -83,18 +99,9 @@ def parse_github_url(url: str) -> tuple[str, str]:
     Returns:
         Tuple of (owner, repo_name)
     """
-    # Handle shorthand format (owner/repo)
-    if "/" in url and not url.startswith("http"):
-        parts = url.split("/")
-        return parts[0], parts[1].replace(".git", "")
-
-    # Handle full URL
-    parsed = urlparse(url)
-    path = parsed.path.strip("/")
-    parts = path.split("/")
-
-    if len(parts) >= 2:
-        return parts[0], parts[1].replace(".git", "")
+    match = _GITHUB_URL_RE.match(url)
+    if match:
+        return match.group(1), match.group(2)
 
     raise ValueError(f"Invalid GitHub URL: {url}")
 
@@ -133,11 +140,11 @@ def clone_repo(
     if progress:
         with progress:
             task = progress.add_task(f"Cloning {owner}/{repo_name}...", total=None)
-            Repo.clone_from(repo_url, str(target_dir), depth=1)
+            Repo.clone_from(repo_url, str(target_dir), env=_CLONE_ENV, **CLONE_OPTIONS)
             progress.remove_task(task)
     else:
         console.print(f"[cyan]→[/cyan] Cloning {owner}/{repo_name}...")
-        Repo.clone_from(repo_url, str(target_dir), depth=1)
+        Repo.clone_from(repo_url, str(target_dir), env=_CLONE_ENV, **CLONE_OPTIONS)
 
     console.print(f"[green]✓[/green] Cloned to {target_dir}")
     return target_dir
@@ -171,11 +178,7 @@ def should_skip(path: Path) -> bool:
     Returns:
         True if file should be skipped
     """
-    path_str = str(path)
-    for pattern in SKIP_PATTERNS:
-        if re.search(pattern, path_str):
-            return True
-    return False
+    return _SKIP_RE.search(str(path)) is not None
 
 
 def get_file_type(path: Path) -> Optional[str]:
@@ -187,11 +190,7 @@ def get_file_type(path: Path) -> Optional[str]:
     Returns:
         File type name or None if not translatable
     """
-    ext = path.suffix.lower()
-    for file_type, extensions in TRANSLATABLE_EXTENSIONS.items():
-        if ext in extensions:
-            return file_type
-    return None
+    return _EXT_TO_TYPE.get(path.suffix.lower())
 
 
 def filter_translatable_files(files: list[Path]) -> dict[str, list[Path]]:
@@ -216,3 +215,53 @@ def filter_translatable_files(files: list[Path]) -> dict[str, list[Path]]:
             result[file_type].append(file_path)
 
     return result
+
+
+def scan_translatable(repo_path: Path) -> Iterator[tuple[str, str]]:
+    """Walk a repository and yield its translatable files.
+
+    Skipped directories (e.g. .git, node_modules) are pruned without being
+    read, and files are classified while scanning.
+
+    Args:
+        repo_path: Path to cloned repository
+
+    Yields:
+        Tuples of (file_type, path relative to repo root, "/"-separated)
+    """
+    stack = [(os.fspath(repo_path), "")]
+    while stack:
+        dir_path, prefix = stack.pop()
+        try:
+            it = os.scandir(dir_path)
+        except OSError:
+            continue  # Like os.walk, skip directories that can't be read
+        with it:
+            for entry in it:
+                rel = prefix + entry.name
+                if entry.is_dir():
+                    # Like os.walk, don't descend into symlinked directories
+                    if not entry.is_symlink() and not _SKIP_DIR_RE.search(rel + "/"):
+                        stack.append((entry.path, rel + "/"))
+                    continue
+                file_type = _EXT_TO_TYPE.get(os.path.splitext(entry.name)[1].lower())
+                if file_type and not _SKIP_RE.search(rel):
+                    yield file_type, rel
+
+
+def find_translatable_files(repo_path: Path) -> dict[str, list[Path]]:
+    """Scan a repository and group its translatable files by type.
+
+    Equivalent to filter_translatable_files(get_file_list(repo_path)) in a
+    single pass over the tree.
+
+    Args:
+        repo_path: Path to cloned repository
+
+    Returns:
+        Dictionary mapping file type to sorted list of relative file paths
+    """
+    result: dict[str, list[Path]] = {}
+    for path, file_type in sorted((Path(rel), t) for t, rel in scan_translatable(repo_path)):
+        result.setdefault(file_type, []).append(path)
+    return result
@@ -0,0 +1,188 @@
+"""Persistent cache of translated texts.
+
+Uses diskcache when it is installed and falls back to a SQLite file.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import diskcache
+
+    HAS_DISKCACHE = True
+except ImportError:
+    HAS_DISKCACHE = False
+    diskcache = None
+
+# Errors from an unusable store (unwritable directory, corrupt or locked database)
+CACHE_ERRORS: tuple[type[Exception], ...] = (OSError, sqlite3.Error)
+if HAS_DISKCACHE:
+    CACHE_ERRORS += (diskcache.Timeout,)
+
+# Cache location
+CACHE_DIR = Path.home() / ".cache" / "repo_translate"
+
+# Entries expire 30 days after they were last used
+DEFAULT_EXPIRE = 30 * 86400
+
+# Least recently used entries are evicted beyond this many
+DEFAULT_MAX_ENTRIES = 200_000
+# Size limit for the diskcache backend, which evicts by size rather than count
+DISKCACHE_SIZE_LIMIT = 256 * 1024 * 1024
+
+
+def cache_key(model: str, source_lang: str, target_lang: str, prompt_hash: str, text: str) -> str:
+    """Build the cache key for one text.
+
+    Args:
+        model: Model name
+        source_lang: Source language code
+        target_lang: Target language code
+        prompt_hash: Hash of the prompt template, so prompt edits invalidate entries
+        text: Source text
+
+    Returns:
+        Hex digest identifying the translation
+    """
+    h = hashlib.blake2b(digest_size=20)
+    for part in (model, source_lang, target_lang, prompt_hash, text):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class TranslationCache:
+    """Key/value store mapping cache keys to translated texts.
+
+    Each lookup hit renews the entry's expiry, so entries expire (and are
+    evicted) least recently used first.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        expire: int = DEFAULT_EXPIRE,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """Open (or create) the cache, dropping expired entries.
+
+        Args:
+            directory: Cache directory (default: ~/.cache/repo_translate)
+            expire: Seconds after its last use before an entry expires
+            max_entries: Entries kept by the SQLite fallback before the least
+                recently used are evicted
+        """
+        self.directory = Path(directory) if directory else CACHE_DIR
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.expire = expire
+        self.max_entries = max_entries
+
+        # diskcache is untyped; exactly one of the two backends is set
+        self._cache: Any = None
+        self._db: Optional[sqlite3.Connection] = None
+        if HAS_DISKCACHE:
+            self._cache = diskcache.Cache(
+                str(self.directory / "translations"),
+                eviction_policy="least-recently-used",
+                size_limit=DISKCACHE_SIZE_LIMIT,
+            )
+            self._cache.expire()
+            return
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self.directory / "translations.sqlite3", check_same_thread=False
+        )
+        try:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS translations "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS translations_expires ON translations (expires)"
+            )
+            self._db.execute("DELETE FROM translations WHERE expires <= ?", (time.time(),))
+            self._evict(self._db)
+            self._db.commit()
+        except sqlite3.Error:
+            self._db.close()
+            raise
+
+    def _evict(self, db: sqlite3.Connection) -> None:
+        """Delete the least recently used entries beyond max_entries."""
+        (count,) = db.execute("SELECT COUNT(*) FROM translations").fetchone()
+        if count > self.max_entries:
+            db.execute(
+                "DELETE FROM translations WHERE key IN "
+                "(SELECT key FROM translations ORDER BY expires LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def get_many(self, keys: list[str]) -> list[Optional[str]]:
+        """Look up several keys.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached translation for each key, or None on a miss
+        """
+        db = self._db
+        if db is None:
+            return [self._cache.get(key) for key in keys]
+
+        now = time.time()
+        with self._lock:
+            found: dict[str, str] = {}
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i : i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = db.execute(
+                    "SELECT key, value FROM translations "
+                    f"WHERE expires > ? AND key IN ({placeholders})",
+                    (now, *chunk),
+                )
+                found.update(rows)
+            if found:
+                # Renew the hits so eviction goes by last use
+                db.executemany(
+                    "UPDATE translations SET expires = ? WHERE key = ?",
+                    [(now + self.expire, key) for key in found],
+                )
+                db.commit()
+        return [found.get(key) for key in keys]
+
+    def set_many(self, items: list[tuple[str, str]]) -> None:
+        """Store several translations.
+
+        Args:
+            items: (key, translation) pairs
+        """
+        if not items:
+            return
+        db = self._db
+        if db is None:
+            for key, value in items:
+                self._cache.set(key, value, expire=self.expire)
+            return
+
+        expires = time.time() + self.expire
+        with self._lock:
+            db.executemany(
+                "INSERT OR REPLACE INTO translations (key, value, expires) VALUES (?, ?, ?)",
+                [(key, value, expires) for key, value in items],
+            )
+            self._evict(db)
+            db.commit()
+
+    def close(self) -> None:
+        """Close the underlying store."""
+        if self._db is not None:
+            self._db.close()
+        else:
+            self._cache.close()
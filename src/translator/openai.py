@@ -3,15 +3,93 @@
 Supports OpenAI, DeepSeek, Zhipu (智谱), and any OpenAI-compatible API.
 """
 
-from typing import Optional
-
-from openai import OpenAI
+import asyncio
+import atexit
+import hashlib
+import json
+import re
+import threading
+from contextlib import aclosing
+from itertools import chain
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterator,
+    Optional,
+    TypeVar,
+    cast,
+)
+
+import httpx
+from openai import APIConnectionError, APIStatusError, AsyncOpenAI, AsyncStream, BadRequestError
+from openai.types.chat import ChatCompletionChunk, ChatCompletionMessageParam
 from rich.console import Console
-from tenacity import retry, stop_after_attempt, wait_exponential
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+from .cache import CACHE_ERRORS, TranslationCache, cache_key
+from .ratelimit import RateLimiter
 
 console = Console()
 
-LANGUAGE_NAMES = {
+# Upper bound on the completion budget of a request
+MAX_TOKENS = 4096
+# Attempts per request on transient errors (see _is_retryable)
+MAX_ATTEMPTS = 3
+# Times a batch with a miscounted response is halved before going one by one
+MAX_SPLIT_DEPTH = 4
+
+# Batch requests ask for a JSON object {"translations": [...]}
+BATCH_USER_PROMPT = 'Translate the "text" of each input. Return JSON with key "translations" as a list of {count} strings in input order. Inputs:\n'
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+# System prompts are constant so that providers can cache the prefix; the
+# languages are appended after them and any context goes in the user message.
+BATCH_SYSTEM_PROMPT = """You are a professional translator specializing in technical documentation and code comments.
+Translate the given texts from the source language to the target language named at the end of this message.
+
+Rules:
+1. Preserve all code syntax, variable names, and technical terms
+2. Keep markdown formatting intact (headers, links, code blocks, etc.)
+3. Maintain the original tone and style
+4. For code comments, keep them concise and clear
+5. Do not translate URLs, file paths, or command-line examples
+6. Preserve placeholder variables like {name}, %s, {0}, etc.
+7. Return ONLY the requested JSON, nothing else"""
+
+SINGLE_SYSTEM_PROMPT = "Translate the text from the source language to the target language named at the end of this message. Preserve code syntax, markdown formatting, and technical terms. Return ONLY the translation."
+
+# A batch's translation must fit in MAX_TOKENS. Output is about as long as the
+# input; estimate 3 characters per token (safe for CJK) and keep some slack.
+BATCH_TOKEN_BUDGET = MAX_TOKENS - 512
+CHARS_PER_TOKEN = 3
+ITEM_OVERHEAD_TOKENS = 8
+
+# Jobs with more texts than this use the Batch API when it is enabled
+BATCH_API_THRESHOLD = 500
+# Batch API job states after which no more output will appear
+BATCH_JOB_DONE_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Cached translations are invalidated whenever the prompts change
+_PROMPT_HASH = hashlib.blake2b(
+    "\0".join((BATCH_SYSTEM_PROMPT, BATCH_USER_PROMPT, SINGLE_SYSTEM_PROMPT)).encode("utf-8"),
+    digest_size=8,
+).hexdigest()
+
+T = TypeVar("T")
+
+# Read-only: shared by every translator
+LANGUAGE_NAMES = MappingProxyType({
     "zh": "Chinese",
     "en": "English",
     "ja": "Japanese",
@@ -24,7 +102,7 @@ LANGUAGE_NAMES = {
     "it": "Italian",
     "ar": "Arabic",
     "hi": "Hindi",
-}
+})
 
 # Popular OpenAI-compatible providers
 PROVIDER_BASE_URLS = {
@@ -49,6 +127,186 @@ PROVIDER_MODELS = {
 }
 
 
+def _pack_batches(texts: list[str], max_items: int) -> Iterator[list[str]]:
+    """Split texts into consecutive batches that fit the completion budget.
+
+    A batch is closed when adding the next text would exceed
+    BATCH_TOKEN_BUDGET or max_items; a text larger than the budget gets a
+    batch of its own.
+
+    Args:
+        texts: Texts in order
+        max_items: Maximum texts per batch
+
+    Yields:
+        Batches, in order
+    """
+    current: list[str] = []
+    current_tokens = 0
+    for text in texts:
+        tokens = len(text) // CHARS_PER_TOKEN + ITEM_OVERHEAD_TOKENS
+        if current and (
+            current_tokens + tokens > BATCH_TOKEN_BUDGET or len(current) >= max_items
+        ):
+            yield current
+            current = []
+            current_tokens = 0
+        current.append(text)
+        current_tokens += tokens
+    if current:
+        yield current
+
+
+class TruncatedResponseError(Exception):
+    """The completion stopped because it reached max_tokens."""
+
+
+def _estimate_max_tokens(texts: list[str]) -> int:
+    """Completion budget for translating texts.
+
+    Translations are rarely more than 1.5x the input; the budget allows
+    about twice the input plus per-item and fixed slack, up to MAX_TOKENS.
+    """
+    input_tokens = sum(len(text) for text in texts) // CHARS_PER_TOKEN
+    return min(MAX_TOKENS, input_tokens * 2 + ITEM_OVERHEAD_TOKENS * len(texts) + 512)
+
+
+def _dedupe(texts: list[str]) -> tuple[list[str], list[int]]:
+    """Find the distinct texts.
+
+    Returns:
+        Distinct texts in first-seen order, and the index of each input among them
+    """
+    position: dict[str, int] = {}
+    index_map = [position.setdefault(text, len(position)) for text in texts]
+    return list(position), index_map
+
+
+# Texts returned as-is without a request: blank, a URL, or a bare path or
+# identifier. A bare token only counts when it has a code marker (_, /, \, a
+# digit, an inner dot or camelCase), so plain words like "Initialize" still
+# get translated.
+_PASSTHROUGH_RE = re.compile(
+    r"\s*|https?://\S+"
+    r"|(?=[/\\A-Za-z0-9_.\-]*?(?:[_/\\0-9]|[A-Za-z]\.[A-Za-z]|[a-z][A-Z]))[/\\A-Za-z0-9_.\-]+"
+)
+
+
+def _language_suffix(source_name: str, target_name: str) -> str:
+    return f"\n\nSource language: {source_name}\nTarget language: {target_name}"
+
+
+_JSON_DECODER = json.JSONDecoder()
+# Whitespace and commas between list elements
+_ITEM_GAP_RE = re.compile(r"[\s,]*")
+
+
+def _translation_text(item: Any) -> Optional[str]:
+    """Get the translation from one element of the "translations" list.
+
+    Models usually return plain strings but sometimes echo the input shape
+    ({"id": ..., "text": ...}).
+    """
+    if isinstance(item, dict):
+        item = item.get("text")
+    if isinstance(item, str):
+        return item.strip()
+    return None
+
+
+def _parse_translations(content: str) -> Optional[list[str]]:
+    """Parse a complete {"translations": [...]} response.
+
+    Returns:
+        The translations, or None if the response doesn't follow the schema
+    """
+    try:
+        items = json.loads(content)["translations"]
+    except (json.JSONDecodeError, KeyError, TypeError):
+        return None
+    if not isinstance(items, list):
+        return None
+    translations = []
+    for item in items:
+        text = _translation_text(item)
+        if text is None:
+            return None
+        translations.append(text)
+    return translations
+
+
+async def _iter_json_translations(chunks: AsyncIterator[str]) -> AsyncGenerator[str, None]:
+    """Yield the elements of a streamed {"translations": [...]} response as they complete.
+
+    Stops at the first element that isn't a translation, so a malformed
+    response yields too few items.
+    """
+    buf = ""
+    in_list = False  # Whether the opening "[" has arrived
+    async for chunk in chunks:
+        buf += chunk
+        if not in_list:
+            start = buf.find("[")
+            if start < 0:
+                continue
+            buf = buf[start + 1 :]
+            in_list = True
+        elif '"' not in chunk and "}" not in chunk:
+            continue  # Nothing can have completed
+        pos = 0
+        while True:
+            gap = _ITEM_GAP_RE.match(buf, pos)
+            if gap is not None:
+                pos = gap.end()
+            if pos >= len(buf) or buf[pos] not in '"{':
+                break
+            try:
+                item, pos = _JSON_DECODER.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                break  # Element not complete yet
+            text = _translation_text(item)
+            if text is None:
+                return
+            yield text
+        # Keep only the unfinished element
+        buf = buf[pos:]
+
+
+class StreamInterruptedError(Exception):
+    """Raised when a response stream fails after part of its text was yielded."""
+
+
+# Status codes worth retrying besides 5xx: timeout, conflict and rate limit
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a request that failed with this error may succeed if sent again.
+
+    Connection failures and timeouts (APITimeoutError is an APIConnectionError),
+    transport errors while streaming, rate limits and server errors are
+    transient; other API errors (bad request, authentication, ...) would fail
+    again.
+    """
+    if isinstance(error, (APIConnectionError, httpx.TransportError)):
+        return True
+    if isinstance(error, APIStatusError):
+        return error.status_code >= 500 or error.status_code in RETRYABLE_STATUS_CODES
+    return False
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Get the delay in seconds requested by a Retry-After header, if any."""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None  # Connection errors have no response
+    value = response.headers.get("retry-after")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
 class OpenAITranslator:
     """Translator using OpenAI-compatible API.
 
@@ -56,12 +314,23 @@ class OpenAITranslator:
     OpenAI-compatible API endpoint.
     """
 
+    # Shared by all instances: the event loop behind the blocking wrappers, and
+    # one connection pool (HTTP/2 when h2 is installed) used from that loop.
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _loop_lock = threading.Lock()
+    _http_client: Optional[httpx.AsyncClient] = None
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         model: Optional[str] = None,
         provider: str = "openai",
+        max_concurrency: int = 8,
+        rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
+        use_cache: bool = True,
+        batch_api: bool = False,
     ):
         """Initialize the translator.
 
@@ -70,6 +339,12 @@ class OpenAITranslator:
             base_url: Custom base URL (overrides provider default)
             model: Model to use (overrides provider default)
             provider: Provider name for default settings
+            max_concurrency: Maximum number of requests in flight
+            rpm: Requests-per-minute limit (default: unlimited)
+            tpm: Tokens-per-minute limit (default: unlimited)
+            use_cache: Reuse translations stored on disk by earlier runs
+            batch_api: Send large jobs through the provider's Batch API
+                (cheaper, but results may take hours)
         """
         # Resolve base_url
         if base_url:
@@ -88,20 +363,218 @@ class OpenAITranslator:
             self.model = PROVIDER_MODELS["openai"]
 
         # Initialize client
-        self.client = OpenAI(
+        # Retries are handled in _stream_completion, which honors Retry-After and
+        # also restarts streams that break before yielding text
+        self.client = AsyncOpenAI(
             api_key=api_key,
             base_url=self.base_url,
+            max_retries=0,
+            # Some SDK releases annotate http_client with their own vendored httpx
+            # class; any httpx.AsyncClient works at runtime
+            http_client=self._shared_http_client(),  # type: ignore[arg-type]
         )
         self.provider = provider
+        self.batch_api = batch_api
+        # Cleared when the provider rejects response_format (see _translate_uncached)
+        self.json_mode = True
+        self.max_concurrency = max_concurrency
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate_limiter = RateLimiter(rpm=rpm, tpm=tpm)
+
+        self.cache: Optional[TranslationCache] = None
+        if use_cache:
+            try:
+                self.cache = TranslationCache()
+            except CACHE_ERRORS as e:
+                console.print(f"[yellow]![/yellow] Translation cache disabled: {e}")
+
+    def close(self) -> None:
+        """Close the translation cache.
+
+        The shared connection pool stays open for other translators; it is
+        closed at exit (see close_shared).
+        """
+        cache, self.cache = self.cache, None
+        if cache is not None:
+            cache.close()
+
+    def _disable_cache(self, error: Exception) -> None:
+        """Stop using a cache that failed mid-run; translation carries on without it."""
+        if self.cache is not None:
+            self.cache = None
+            console.print(f"[yellow]![/yellow] Translation cache disabled: {error}")
+
+    @classmethod
+    def _shared_http_client(cls) -> httpx.AsyncClient:
+        with cls._loop_lock:
+            if cls._http_client is None:
+                cls._http_client = httpx.AsyncClient(
+                    http2=HAS_H2,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
+                    timeout=httpx.Timeout(120.0, connect=10.0),
+                )
+                atexit.register(cls.close_shared)
+            return cls._http_client
+
+    @classmethod
+    def _get_loop(cls) -> asyncio.AbstractEventLoop:
+        with cls._loop_lock:
+            if cls._loop is None:
+                cls._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=cls._loop.run_forever, name="translator-loop", daemon=True
+                ).start()
+            return cls._loop
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine to completion from synchronous code.
+
+        The async client is tied to the event loop it first runs on, so all
+        blocking calls (from any thread) share one background loop instead of
+        each starting its own with asyncio.run().
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop()).result()
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the shared HTTP connection pool."""
+        client, cls._http_client = cls._http_client, None
+        if client is not None:
+            await client.aclose()
+
+    @classmethod
+    def close_shared(cls) -> None:
+        """Close the shared connection pool from synchronous code (registered with atexit)."""
+        if cls._http_client is None:
+            return
+        try:
+            if cls._loop is not None:
+                asyncio.run_coroutine_threadsafe(cls.aclose(), cls._loop).result(timeout=5)
+            else:
+                asyncio.run(cls.aclose())
+        except Exception:
+            pass  # Best effort at shutdown
+
+    async def _stream_completion(
+        self, messages: list[ChatCompletionMessageParam], **kwargs: Any
+    ) -> AsyncGenerator[str, None]:
+        """Stream the text of a chat completion within the concurrency and rate limits.
+
+        Requests that fail with a transient error (see _is_retryable) are
+        retried after the delay given by the provider's Retry-After header, or
+        an exponential backoff; so are streams that break before yielding any
+        text. The semaphore is held until the stream is consumed or closed.
+
+        Raises:
+            TruncatedResponseError: After the text, if the completion hit max_tokens
+            StreamInterruptedError: If the stream broke after yielding some text;
+                the caller has to start over
+        """
+        # Rough token estimate: ~4 characters per token plus the completion budget
+        prompt_chars = sum(
+            len(content) for m in messages if isinstance(content := m.get("content"), str)
+        )
+        estimated_tokens = prompt_chars // 4 + kwargs.get("max_tokens", MAX_TOKENS)
+        for attempt in range(MAX_ATTEMPTS):
+            await self._rate_limiter.acquire(estimated_tokens)
+            async with self._semaphore:
+                yielded = False
+                finish_reason = None
+                try:
+                    # **kwargs hides which overload applies; stream=True returns a stream
+                    stream = cast(
+                        AsyncStream[ChatCompletionChunk],
+                        await self.client.chat.completions.create(
+                            model=self.model, messages=messages, stream=True, **kwargs
+                        ),
+                    )
+                    async with stream:
+                        async for chunk in stream:
+                            if not chunk.choices:
+                                continue
+                            choice = chunk.choices[0]
+                            if choice.delta.content:
+                                yielded = True
+                                yield choice.delta.content
+                            finish_reason = choice.finish_reason or finish_reason
+                except Exception as e:
+                    if not _is_retryable(e):
+                        raise
+                    if yielded:
+                        raise StreamInterruptedError(str(e)) from e
+                    if attempt == MAX_ATTEMPTS - 1:
+                        raise
+                    delay = _retry_after(e) or min(4 * 2**attempt, 60)
+                else:
+                    if finish_reason == "length":
+                        raise TruncatedResponseError()
+                    return
+            await asyncio.sleep(delay)
+
+    def _batch_messages(
+        self,
+        texts: list[str],
+        target_lang: str,
+        source_lang: str,
+        context: str,
+    ) -> list[ChatCompletionMessageParam]:
+        target_name = LANGUAGE_NAMES.get(target_lang, target_lang)
+        source_name = LANGUAGE_NAMES.get(source_lang, source_lang)
+
+        system_prompt = BATCH_SYSTEM_PROMPT + _language_suffix(source_name, target_name)
+
+        # Context goes in the user message so the system prompt is the same for
+        # every file type and stays cacheable
+        user_prompt = BATCH_USER_PROMPT.format(count=len(texts)) + json.dumps(
+            [{"id": i, "text": text} for i, text in enumerate(texts)], ensure_ascii=False
+        )
+        if context:
+            user_prompt = f"[Context: {context}]\n\n{user_prompt}"
+
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
 
-    def _get_language_name(self, lang_code: str) -> str:
-        return LANGUAGE_NAMES.get(lang_code, lang_code)
+    def _json_kwargs(self) -> dict[str, Any]:
+        """Request arguments enabling JSON mode, unless the provider rejected it."""
+        return {"response_format": JSON_RESPONSE_FORMAT} if self.json_mode else {}
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-    )
-    def translate_batch(
+    async def stream_batch(
+        self,
+        texts: list[str],
+        target_lang: str = "zh",
+        source_lang: str = "en",
+        context: str = "",
+        max_tokens: Optional[int] = None,
+    ) -> AsyncGenerator[str, None]:
+        """Translate a batch, yielding each translation as soon as it is complete.
+
+        Args:
+            texts: Texts to translate
+            target_lang: Target language code
+            source_lang: Source language code
+            context: Extra context for the model
+            max_tokens: Completion budget (default: estimated from the input)
+
+        Yields:
+            Translations in input order; the count is not validated
+
+        Raises:
+            TruncatedResponseError: If the response was cut off at max_tokens
+        """
+        chunks = self._stream_completion(
+            self._batch_messages(texts, target_lang, source_lang, context),
+            temperature=0.3,
+            max_tokens=max_tokens or _estimate_max_tokens(texts),
+            **self._json_kwargs(),
+        )
+        async with aclosing(chunks):
+            async for translated in _iter_json_translations(chunks):
+                yield translated
+
+    async def translate_batch(
         self,
         texts: list[str],
         target_lang: str = "zh",
@@ -110,101 +583,404 @@ class OpenAITranslator:
     ) -> list[str]:
         if not texts:
             return []
+        return await self._with_cache(
+            texts,
+            target_lang,
+            source_lang,
+            lambda pending: self._translate_uncached(pending, target_lang, source_lang, context),
+        )
+
+    async def _with_cache(
+        self,
+        texts: list[str],
+        target_lang: str,
+        source_lang: str,
+        translate: Callable[[list[str]], Awaitable[list[str]]],
+    ) -> list[str]:
+        """Translate each distinct text once, serving cache hits without a request.
 
-        target_name = self._get_language_name(target_lang)
-        source_name = self._get_language_name(source_lang)
+        Texts are returned unchanged when the languages match, and so are
+        texts with nothing to translate (see _PASSTHROUGH_RE).
 
-        system_prompt = f"""You are a professional translator specializing in technical documentation and code comments.
-Translate the following texts from {source_name} to {target_name}.
+        Args:
+            texts: Texts to translate
+            target_lang: Target language code
+            source_lang: Source language code
+            translate: Coroutine function translating a list of texts
 
-Rules:
-1. Preserve all code syntax, variable names, and technical terms
-2. Keep markdown formatting intact (headers, links, code blocks, etc.)
-3. Maintain the original tone and style
-4. For code comments, keep them concise and clear
-5. Do not translate URLs, file paths, or command-line examples
-6. Preserve placeholder variables like {{name}}, %s, {{0}}, etc.
-7. Return ONLY the translated text, nothing else"""
+        Returns:
+            Translations in input order
+        """
+        if source_lang == target_lang:
+            return list(texts)
+
+        # Nothing to translate in blank texts, URLs, paths or identifiers
+        pending = [i for i, text in enumerate(texts) if not _PASSTHROUGH_RE.fullmatch(text)]
+        if len(pending) < len(texts):
+            results = list(texts)
+            if pending:
+                translated = await self._with_cache(
+                    [texts[i] for i in pending], target_lang, source_lang, translate
+                )
+                for i, text in zip(pending, translated):
+                    results[i] = text
+            return results
 
-        if context:
-            system_prompt += f"\n\nContext: {context}"
+        # Repeated texts are translated (and looked up) once
+        unique, index_map = _dedupe(texts)
+        if len(unique) < len(texts):
+            translated = await self._with_cache(unique, target_lang, source_lang, translate)
+            return [translated[i] for i in index_map]
 
-        user_prompt = "Translate the following texts. Each item is separated by '---SEPARATOR---'. Return translations in the same order with the same separator.\n\n"
-        user_prompt += "\n\n---SEPARATOR---\n\n".join(texts)
+        cache = self.cache
+        if cache is None:
+            return await translate(texts)
 
+        keys = [
+            cache_key(self.model, source_lang, target_lang, _PROMPT_HASH, text) for text in texts
+        ]
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.3,
-                max_tokens=4096,
-            )
-
-            translated = response.choices[0].message.content or ""
-            results = translated.split("---SEPARATOR---")
+            cached = cache.get_many(keys)
+        except CACHE_ERRORS as e:
+            self._disable_cache(e)
+            return await translate(texts)
+        pending = [i for i, hit in enumerate(cached) if hit is None]
+        # Misses keep their source text until translated below
+        results = [text if hit is None else hit for text, hit in zip(texts, cached)]
+        if pending:
+            translated = await translate([texts[i] for i in pending])
+            new_entries = []
+            for i, text in zip(pending, translated):
+                results[i] = text
+                # Failed translations come back as the original text; don't cache those
+                if text and text != texts[i]:
+                    new_entries.append((keys[i], text))
+            try:
+                cache.set_many(new_entries)
+            except CACHE_ERRORS as e:
+                self._disable_cache(e)
+        return results
 
-            results = [r.strip() for r in results]
+    async def _translate_uncached(
+        self,
+        texts: list[str],
+        target_lang: str,
+        source_lang: str,
+        context: str,
+        _depth: int = 0,
+    ) -> list[str]:
+        max_tokens = _estimate_max_tokens(texts)
+        restarts = 0
+        try:
+            while True:
+                results = []
+                json_mode = self.json_mode
+                stream = self.stream_batch(texts, target_lang, source_lang, context, max_tokens)
+                try:
+                    async with aclosing(stream):
+                        async for translated in stream:
+                            results.append(translated)
+                            if len(results) > len(texts):
+                                break  # Malformed response; stop paying for the rest of it
+                except TruncatedResponseError:
+                    # The estimate was too low; retry with a larger budget
+                    if max_tokens < MAX_TOKENS:
+                        max_tokens = min(MAX_TOKENS, max_tokens * 2)
+                        continue
+                except StreamInterruptedError:
+                    restarts += 1
+                    if restarts < MAX_ATTEMPTS:
+                        continue
+                    raise
+                except BadRequestError as e:
+                    if not json_mode:
+                        raise
+                    # Some OpenAI-compatible backends reject response_format; the
+                    # prompt asks for JSON anyway, so retry without it
+                    if self.json_mode:
+                        self.json_mode = False
+                        console.print(
+                            f"[yellow]![/yellow] Provider rejected JSON mode, retrying without it: {e}"
+                        )
+                    continue
+                break
 
             if len(results) != len(texts):
-                console.print(
-                    f"[yellow]![/yellow] Translation count mismatch: {len(results)} vs {len(texts)}, using fallback"
+                if len(texts) == 1 or _depth >= MAX_SPLIT_DEPTH:
+                    console.print(
+                        f"[yellow]![/yellow] Translation count mismatch: {len(results)} vs {len(texts)}, using fallback"
+                    )
+                    return await self._translate_one_by_one(texts, target_lang, source_lang)
+                # Retry each half as its own batch; usually only one half is malformed
+                mid = len(texts) // 2
+                halves = await asyncio.gather(
+                    self._translate_uncached(
+                        texts[:mid], target_lang, source_lang, context, _depth + 1
+                    ),
+                    self._translate_uncached(
+                        texts[mid:], target_lang, source_lang, context, _depth + 1
+                    ),
                 )
-                return self._translate_one_by_one(texts, target_lang, source_lang)
+                return halves[0] + halves[1]
 
             return results
 
         except Exception as e:
             console.print(f"[red]✗[/red] Batch translation failed: {e}")
-            return self._translate_one_by_one(texts, target_lang, source_lang)
+            return await self._translate_one_by_one(texts, target_lang, source_lang)
 
-    def _translate_one_by_one(
+    async def _translate_one_by_one(
         self,
         texts: list[str],
         target_lang: str,
         source_lang: str,
     ) -> list[str]:
-        results = []
-        target_name = self._get_language_name(target_lang)
-        source_name = self._get_language_name(source_lang)
-
-        for text in texts:
-            try:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": f"Translate from {source_name} to {target_name}. Preserve code syntax, markdown formatting, and technical terms. Return ONLY the translation.",
-                        },
+        target_name = LANGUAGE_NAMES.get(target_lang, target_lang)
+        source_name = LANGUAGE_NAMES.get(source_lang, source_lang)
+        system_prompt = SINGLE_SYSTEM_PROMPT + _language_suffix(source_name, target_name)
+
+        async def translate_one(text: str) -> str:
+            max_tokens = _estimate_max_tokens([text])
+            restarts = 0
+            while True:
+                parts: list[str] = []
+                chunks = self._stream_completion(
+                    [
+                        {"role": "system", "content": system_prompt},
                         {"role": "user", "content": text},
                     ],
                     temperature=0.3,
+                    max_tokens=max_tokens,
                 )
-                results.append(response.choices[0].message.content or text)
-            except Exception:
-                results.append(text)
+                try:
+                    async with aclosing(chunks):
+                        async for chunk in chunks:
+                            parts.append(chunk)
+                except TruncatedResponseError:
+                    if max_tokens < MAX_TOKENS:
+                        max_tokens = min(MAX_TOKENS, max_tokens * 2)
+                        continue
+                except StreamInterruptedError as e:
+                    restarts += 1
+                    if restarts < MAX_ATTEMPTS:
+                        continue
+                    console.print(f"[yellow]![/yellow] Left text untranslated: {e}")
+                    return text
+                except Exception as e:
+                    console.print(f"[yellow]![/yellow] Left text untranslated: {e}")
+                    return text
+                return "".join(parts) or text
+
+        return list(await asyncio.gather(*(translate_one(text) for text in texts)))
+
+    async def translate_offline(
+        self,
+        texts: list[str],
+        target_lang: str = "zh",
+        source_lang: str = "en",
+        context: str = "",
+        batch_size: int = 10,
+        poll_interval: float = 30,
+    ) -> list[str]:
+        """Translate texts through the provider's Batch API.
 
-        return results
+        Batch jobs cost less than live requests but may take up to 24 hours,
+        so this suits large non-interactive runs. Batches missing from the
+        job output, or with a mismatched count, are retranslated live.
 
-    def translate_file_comments(
+        Args:
+            texts: Texts to translate
+            target_lang: Target language code
+            source_lang: Source language code
+            context: Extra context for the model
+            batch_size: Maximum texts per request within the job
+            poll_interval: Seconds between job status checks
+
+        Returns:
+            Translations in input order
+        """
+        if not texts:
+            return []
+        return await self._with_cache(
+            texts,
+            target_lang,
+            source_lang,
+            lambda pending: self._translate_offline_uncached(
+                pending, target_lang, source_lang, context, batch_size, poll_interval
+            ),
+        )
+
+    async def _translate_offline_uncached(
+        self,
+        texts: list[str],
+        target_lang: str,
+        source_lang: str,
+        context: str,
+        batch_size: int,
+        poll_interval: float,
+    ) -> list[str]:
+        batches = list(_pack_batches(texts, batch_size))
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": f"idx-{i}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model,
+                        "messages": self._batch_messages(batch, target_lang, source_lang, context),
+                        "temperature": 0.3,
+                        "max_tokens": _estimate_max_tokens(batch),
+                        **self._json_kwargs(),
+                    },
+                },
+                ensure_ascii=False,
+            )
+            for i, batch in enumerate(batches)
+        ]
+
+        outputs: dict[int, list[str]] = {}
+        try:
+            input_file = await self.client.files.create(
+                file=("batch.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch"
+            )
+            job = await self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            console.print(f"[cyan]→[/cyan] Submitted batch job {job.id} ({len(batches)} requests)")
+            while job.status not in BATCH_JOB_DONE_STATES:
+                await asyncio.sleep(poll_interval)
+                job = await self.client.batches.retrieve(job.id)
+
+            if job.output_file_id:
+                content = await self.client.files.content(job.output_file_id)
+                for line in content.text.splitlines():
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    response = record.get("response") or {}
+                    if response.get("status_code") != 200:
+                        continue
+                    idx = int(record["custom_id"].removeprefix("idx-"))
+                    message = response["body"]["choices"][0]["message"]["content"] or ""
+                    translations = _parse_translations(message)
+                    if translations is not None:
+                        outputs[idx] = translations
+            if job.status != "completed":
+                console.print(f"[yellow]![/yellow] Batch job {job.id} ended as {job.status}")
+        except Exception as e:
+            console.print(f"[red]✗[/red] Batch job failed: {e}")
+
+        # Anything the job didn't translate cleanly goes through the live path
+        missing = [i for i, batch in enumerate(batches) if len(outputs.get(i, ())) != len(batch)]
+        retried = await asyncio.gather(
+            *(
+                self._translate_uncached(batches[i], target_lang, source_lang, context)
+                for i in missing
+            )
+        )
+        outputs.update(zip(missing, retried))
+        return list(chain.from_iterable(outputs[i] for i in range(len(batches))))
+
+    async def _translate_packed(
+        self,
+        texts: list[str],
+        target_lang: str,
+        context: str,
+        max_items: int,
+    ) -> list[str]:
+        """Translate texts in packed batches through a bounded queue.
+
+        A producer packs batches while up to max_concurrency consumers send
+        them; the queue bound keeps packing only slightly ahead of the API.
+        """
+        workers = self.max_concurrency
+        queue: asyncio.Queue[Optional[tuple[int, list[str]]]] = asyncio.Queue(maxsize=2 * workers)
+        results: dict[int, list[str]] = {}
+
+        async def produce() -> None:
+            for batch_id, batch in enumerate(_pack_batches(texts, max_items)):
+                await queue.put((batch_id, batch))
+            for _ in range(workers):
+                await queue.put(None)
+
+        async def consume() -> None:
+            while (item := await queue.get()) is not None:
+                batch_id, batch = item
+                results[batch_id] = await self.translate_batch(
+                    batch, target_lang, context=context
+                )
+
+        tasks = [asyncio.ensure_future(produce())]
+        tasks.extend(asyncio.ensure_future(consume()) for _ in range(workers))
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return list(chain.from_iterable(results[i] for i in range(len(results))))
+
+    async def _translate_file_texts(
+        self,
+        texts: list[str],
+        target_lang: str,
+        context: str,
+        batch_size: int,
+    ) -> list[str]:
+        """Translate all texts of one file.
+
+        Duplicates across the whole file are sent once, not once per batch.
+        The distinct texts are packed shortest first, so each batch holds texts
+        of similar length and isn't held up by one long item.
+        """
+        unique, index_map = _dedupe(texts)
+        order = sorted(range(len(unique)), key=lambda i: len(unique[i]))
+        by_length = [unique[i] for i in order]
+        if self.batch_api and len(unique) > BATCH_API_THRESHOLD:
+            translated = await self.translate_offline(
+                by_length, target_lang, context=context, batch_size=batch_size
+            )
+        else:
+            translated = await self._translate_packed(by_length, target_lang, context, batch_size)
+
+        results = [""] * len(unique)
+        for i, text in zip(order, translated):
+            results[i] = text
+        return [results[i] for i in index_map]
+
+    async def translate_file_comments_async(
         self,
         comments: list[str],
         target_lang: str = "zh",
         file_type: str = "",
         batch_size: int = 10,
     ) -> list[str]:
-        results = []
+        context = f"This is from a {file_type} file." if file_type else ""
+        return await self._translate_file_texts(comments, target_lang, context, batch_size)
 
-        for i in range(0, len(comments), batch_size):
-            batch = comments[i : i + batch_size]
-            context = f"This is from a {file_type} file." if file_type else ""
-            translated = self.translate_batch(batch, target_lang, context=context)
-            results.extend(translated)
+    async def translate_markdown_blocks_async(
+        self,
+        blocks: list[str],
+        target_lang: str = "zh",
+        batch_size: int = 3,
+    ) -> list[str]:
+        context = "This is markdown documentation."
+        return await self._translate_file_texts(blocks, target_lang, context, batch_size)
 
-        return results
+    def translate_file_comments(
+        self,
+        comments: list[str],
+        target_lang: str = "zh",
+        file_type: str = "",
+        batch_size: int = 10,
+    ) -> list[str]:
+        """Blocking wrapper around translate_file_comments_async()."""
+        return self._run(
+            self.translate_file_comments_async(comments, target_lang, file_type, batch_size)
+        )
 
     def translate_markdown_blocks(
         self,
@@ -212,13 +988,5 @@ Rules:
         target_lang: str = "zh",
         batch_size: int = 3,
     ) -> list[str]:
-        results = []
-
-        for i in range(0, len(blocks), batch_size):
-            batch = blocks[i : i + batch_size]
-            translated = self.translate_batch(
-                batch, target_lang, context="This is markdown documentation."
-            )
-            results.extend(translated)
-
-        return results
+        """Blocking wrapper around translate_markdown_blocks_async()."""
+        return self._run(self.translate_markdown_blocks_async(blocks, target_lang, batch_size))
@@ -0,0 +1,40 @@
+"""Shared fixtures for the test suite."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Callable
+
+import pytest
+
+from src.translator.openai import OpenAITranslator
+from tests.fakes import FakeCompletions, FakeStream, upper_handler
+
+
+@pytest.fixture
+def make_translator() -> Callable[..., tuple[OpenAITranslator, FakeCompletions]]:
+    """Build a translator whose client is answered by a handler, without a cache."""
+
+    def make(
+        handler: Callable[[dict[str, Any]], FakeStream] = upper_handler, **kwargs: Any
+    ) -> tuple[OpenAITranslator, FakeCompletions]:
+        kwargs.setdefault("use_cache", False)
+        translator = OpenAITranslator(api_key="test", **kwargs)
+        completions = FakeCompletions(handler)
+        translator.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        return translator, completions
+
+    return make
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record asyncio.sleep delays instead of waiting them out."""
+    delays: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay: float, *args: Any) -> None:
+        delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return delays
@@ -0,0 +1,83 @@
+"""Fake OpenAI client objects so translator tests run offline."""
+
+import json
+from types import SimpleNamespace
+from typing import Any, Callable, Optional
+
+import httpx
+
+
+class FakeStream:
+    """Stand-in for AsyncStream[ChatCompletionChunk].
+
+    Yields one chunk per part; the last carries finish_reason. If error is
+    set, it is raised after the parts, like a connection dropping mid-stream.
+    """
+
+    def __init__(
+        self,
+        parts: list[str],
+        finish_reason: str = "stop",
+        error: Optional[Exception] = None,
+    ):
+        self.parts = parts
+        self.finish_reason = finish_reason
+        self.error = error
+
+    async def __aenter__(self) -> "FakeStream":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        pass
+
+    def __aiter__(self) -> Any:
+        return self._chunks()
+
+    async def _chunks(self) -> Any:
+        for i, part in enumerate(self.parts):
+            last = i == len(self.parts) - 1 and self.error is None
+            delta = SimpleNamespace(content=part)
+            choice = SimpleNamespace(delta=delta, finish_reason=self.finish_reason if last else None)
+            yield SimpleNamespace(choices=[choice])
+        if self.error is not None:
+            raise self.error
+
+
+def batch_inputs(request: dict[str, Any]) -> list[str]:
+    """Texts sent in a batch request."""
+    user = request["messages"][-1]["content"]
+    return [item["text"] for item in json.loads(user.split("Inputs:\n", 1)[1])]
+
+
+def json_stream(translations: list[Any], chunk_size: int = 7, **kwargs: Any) -> FakeStream:
+    """Stream a {"translations": [...]} response in small chunks."""
+    payload = json.dumps({"translations": translations}, ensure_ascii=False)
+    parts = [payload[i : i + chunk_size] for i in range(0, len(payload), chunk_size)]
+    return FakeStream(parts, **kwargs)
+
+
+def upper_handler(request: dict[str, Any]) -> FakeStream:
+    """Translate by upper-casing: batches as JSON, single texts as plain text."""
+    user = request["messages"][-1]["content"]
+    if "Inputs:\n" in user:
+        return json_stream([text.upper() for text in batch_inputs(request)])
+    return FakeStream([user.upper()])
+
+
+def status_error(error_class: type[Exception], status: int, **headers: str) -> Exception:
+    """Build an openai APIStatusError subclass as raised for an HTTP response."""
+    request = httpx.Request("POST", "https://api.test/v1/chat/completions")
+    response = httpx.Response(status, request=request, headers=headers)
+    return error_class(f"HTTP {status}", response=response, body=None)
+
+
+class FakeCompletions:
+    """Records create() calls and answers them with a handler."""
+
+    def __init__(self, handler: Callable[[dict[str, Any]], FakeStream]):
+        self.handler = handler
+        self.calls: list[dict[str, Any]] = []
+
+    async def create(self, **kwargs: Any) -> FakeStream:
+        self.calls.append(kwargs)
+        return self.handler(kwargs)
@@ -0,0 +1,109 @@
+"""Tests for the persistent translation cache."""
+
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from src.translator import cache as cache_module
+from src.translator.cache import TranslationCache, cache_key
+
+
+@pytest.fixture(params=["sqlite", "diskcache"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test against each cache backend."""
+    if request.param == "diskcache":
+        if not cache_module.HAS_DISKCACHE:
+            pytest.skip("diskcache is not installed")
+    else:
+        monkeypatch.setattr(cache_module, "HAS_DISKCACHE", False)
+    return str(request.param)
+
+
+@pytest.fixture
+def sqlite_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache_module, "HAS_DISKCACHE", False)
+
+
+@pytest.fixture
+def store(backend: str, tmp_path: Path) -> Iterator[TranslationCache]:
+    cache = TranslationCache(tmp_path)
+    yield cache
+    cache.close()
+
+
+def row_count(cache: TranslationCache) -> int:
+    assert cache._db is not None
+    (count,) = cache._db.execute("SELECT COUNT(*) FROM translations").fetchone()
+    return int(count)
+
+
+def test_cache_key_depends_on_every_part() -> None:
+    parts = ("model", "en", "zh", "prompt", "text")
+    key = cache_key(*parts)
+    assert key == cache_key(*parts)
+    for i in range(len(parts)):
+        changed = list(parts)
+        changed[i] += "x"
+        assert cache_key(*changed) != key
+    # Parts are delimited, so shifting text between them changes the key
+    assert cache_key("ab", "c", "zh", "p", "t") != cache_key("a", "bc", "zh", "p", "t")
+
+
+def test_round_trip(store: TranslationCache) -> None:
+    store.set_many([("a", "甲"), ("b", "乙")])
+    assert store.get_many(["a", "missing", "b"]) == ["甲", None, "乙"]
+
+
+def test_persists_across_instances(backend: str, tmp_path: Path) -> None:
+    cache = TranslationCache(tmp_path)
+    cache.set_many([("a", "甲")])
+    cache.close()
+    cache = TranslationCache(tmp_path)
+    assert cache.get_many(["a"]) == ["甲"]
+    cache.close()
+
+
+def test_expired_entries_are_misses(backend: str, tmp_path: Path) -> None:
+    cache = TranslationCache(tmp_path, expire=-1)
+    cache.set_many([("a", "甲")])
+    assert cache.get_many(["a"]) == [None]
+    cache.close()
+
+
+def test_expired_rows_are_deleted_on_open(sqlite_backend: None, tmp_path: Path) -> None:
+    cache = TranslationCache(tmp_path, expire=-1)
+    cache.set_many([("a", "甲")])
+    cache.close()
+    cache = TranslationCache(tmp_path)
+    assert row_count(cache) == 0
+    cache.close()
+
+
+def test_least_recently_used_rows_are_evicted(sqlite_backend: None, tmp_path: Path) -> None:
+    cache = TranslationCache(tmp_path, max_entries=2)
+    cache.set_many([("a", "甲")])
+    cache.set_many([("b", "乙")])
+    cache.get_many(["a"])  # Now more recently used than b
+    cache.set_many([("c", "丙")])
+    assert row_count(cache) == 2
+    assert cache.get_many(["a", "b", "c"]) == ["甲", None, "丙"]
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_translator_serves_hits_without_requests(
+    backend: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, make_translator
+) -> None:
+    monkeypatch.setattr(cache_module, "CACHE_DIR", tmp_path)
+    batch = ["first comment here", "second comment here"]
+
+    translator, completions = make_translator(use_cache=True)
+    assert await translator.translate_batch(batch, "zh") == [text.upper() for text in batch]
+    translator.close()
+    assert translator.cache is None
+
+    translator, completions = make_translator(use_cache=True)
+    assert await translator.translate_batch(batch, "zh") == [text.upper() for text in batch]
+    assert completions.calls == []
+    translator.close()
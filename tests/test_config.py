@@ -0,0 +1,18 @@
+"""Tests for configuration value handling."""
+
+import pytest
+
+from src.config import _positive_int
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, 8), (4, 4), ("16", 16), (2.0, 2), (0, 8), (-1, 8), ("many", 8), (True, 8)],
+)
+def test_positive_int(value: object, expected: int) -> None:
+    assert _positive_int("max_concurrency", value, 8) == expected
+
+
+def test_positive_int_keeps_unlimited_default() -> None:
+    assert _positive_int("rpm", 0, None) is None
+    assert _positive_int("rpm", "60", None) == 60
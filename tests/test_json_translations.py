@@ -0,0 +1,79 @@
+"""Tests for parsing JSON batch responses."""
+
+import json
+from typing import Any, AsyncIterator
+
+import pytest
+from openai import BadRequestError
+
+from src.translator.openai import _iter_json_translations, _parse_translations
+from tests.fakes import FakeStream, status_error, upper_handler
+
+
+async def _chunks(payload: str, size: int) -> AsyncIterator[str]:
+    for i in range(0, len(payload), size):
+        yield payload[i : i + size]
+
+
+async def stream_items(payload: str, size: int = 7) -> list[str]:
+    return [item async for item in _iter_json_translations(_chunks(payload, size))]
+
+
+TRICKY = ['say "hi"', "a, b] c", "{braces}", "new\nline", "中文 ✓"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 2, 5, 64, 10_000])
+async def test_streamed_items_match_any_chunking(size: int) -> None:
+    payload = json.dumps({"translations": TRICKY}, ensure_ascii=False)
+    assert await stream_items(payload, size) == TRICKY
+
+
+@pytest.mark.asyncio
+async def test_echoed_objects_and_whitespace() -> None:
+    payload = '{\n  "translations": [\n    {"id": 0, "text": " one "},\n    "two"\n  ]\n}'
+    assert await stream_items(payload, 3) == ["one", "two"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("payload", "expected"),
+    [
+        ('{"translations": ["one", 2, "three"]}', ["one"]),
+        ('{"translations": ["one", {"id": 1}]}', ["one"]),
+        ('{"translations": ["one", "tw', ["one"]),
+        ("no json at all", []),
+    ],
+)
+async def test_malformed_responses_yield_too_few(payload: str, expected: list[str]) -> None:
+    assert await stream_items(payload) == expected
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ('{"translations": ["a", {"text": "b"}]}', ["a", "b"]),
+        ('{"translations": []}', []),
+        ('{"translations": "a"}', None),
+        ('{"translations": ["a", null]}', None),
+        ('{"other": []}', None),
+        ("[]", None),
+        ("not json", None),
+    ],
+)
+def test_parse_translations(content: str, expected: Any) -> None:
+    assert _parse_translations(content) == expected
+
+
+@pytest.mark.asyncio
+async def test_json_mode_is_dropped_when_rejected(make_translator) -> None:
+    def handler(request: dict[str, Any]) -> FakeStream:
+        if "response_format" in request:
+            raise status_error(BadRequestError, 400)
+        return upper_handler(request)
+
+    translator, completions = make_translator(handler)
+    texts = ["first comment here", "second comment here"]
+    assert await translator.translate_batch(texts, "zh") == [text.upper() for text in texts]
+    assert translator.json_mode is False
+    assert [("response_format" in call) for call in completions.calls] == [True, False]
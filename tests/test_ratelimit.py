@@ -0,0 +1,53 @@
+"""Tests for the request/token rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.translator.ratelimit import RateLimiter
+
+
+async def _elapsed(limiter: RateLimiter, *tokens: int) -> float:
+    start = time.monotonic()
+    for count in tokens:
+        await limiter.acquire(count)
+    return time.monotonic() - start
+
+
+@pytest.mark.asyncio
+async def test_unlimited_never_waits() -> None:
+    limiter = RateLimiter()
+    assert await _elapsed(limiter, *[10**6] * 1000) < 0.5
+
+
+@pytest.mark.asyncio
+async def test_rpm_allows_a_burst_then_waits() -> None:
+    # 600 rpm refills one request every 0.1s
+    limiter = RateLimiter(rpm=600)
+    assert await _elapsed(limiter, *[0] * 600) < 0.5
+    assert 0.05 < await _elapsed(limiter, 0) < 1
+
+
+@pytest.mark.asyncio
+async def test_tpm_waits_for_tokens() -> None:
+    # 60,000 tpm refills 1,000 tokens per second
+    limiter = RateLimiter(tpm=60_000)
+    assert await _elapsed(limiter, 60_000) < 0.5
+    assert 0.05 < await _elapsed(limiter, 100) < 1
+
+
+@pytest.mark.asyncio
+async def test_oversized_request_waits_for_a_full_bucket() -> None:
+    limiter = RateLimiter(tpm=60_000)
+    # Larger than the whole budget: allowed once the bucket is full, not never
+    assert await _elapsed(limiter, 10**9) < 0.5
+
+
+@pytest.mark.asyncio
+async def test_waiters_share_the_budget() -> None:
+    limiter = RateLimiter(rpm=600)
+    await _elapsed(limiter, *[0] * 600)
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+    assert 0.2 < time.monotonic() - start < 2
@@ -0,0 +1,114 @@
+"""Tests for retrying failed and interrupted requests."""
+
+from typing import Any
+
+import httpx
+import pytest
+from openai import APIConnectionError, AuthenticationError, InternalServerError, RateLimitError
+
+from src.translator.openai import MAX_ATTEMPTS, StreamInterruptedError
+from tests.fakes import FakeStream, json_stream, status_error, upper_handler
+
+TEXTS = ["first comment here", "second comment here"]
+EXPECTED = [text.upper() for text in TEXTS]
+
+
+def failing_first(*errors: Exception) -> Any:
+    """Handler raising the given errors on the first requests, then upper-casing."""
+    pending = list(errors)
+
+    def handler(request: dict[str, Any]) -> FakeStream:
+        if pending:
+            raise pending.pop(0)
+        return upper_handler(request)
+
+    return handler
+
+
+async def collect(translator: Any) -> list[str]:
+    chunks = translator._stream_completion([{"role": "user", "content": "hello there"}])
+    return [chunk async for chunk in chunks]
+
+
+@pytest.mark.asyncio
+async def test_server_error_is_retried_with_backoff(make_translator, sleeps) -> None:
+    translator, completions = make_translator(
+        failing_first(status_error(InternalServerError, 503))
+    )
+    assert await translator.translate_batch(TEXTS, "zh") == EXPECTED
+    assert len(completions.calls) == 2
+    assert sleeps == [4]
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_honors_retry_after(make_translator, sleeps) -> None:
+    translator, completions = make_translator(
+        failing_first(
+            status_error(RateLimitError, 429, **{"retry-after": "1.5"}),
+            status_error(RateLimitError, 429),
+        )
+    )
+    assert await translator.translate_batch(TEXTS, "zh") == EXPECTED
+    assert len(completions.calls) == 3
+    # The header's delay, then exponential backoff without one
+    assert sleeps == [1.5, 8]
+
+
+@pytest.mark.asyncio
+async def test_connection_error_is_retried(make_translator, sleeps) -> None:
+    request = httpx.Request("POST", "https://api.test/v1/chat/completions")
+    translator, completions = make_translator(
+        failing_first(APIConnectionError(request=request))
+    )
+    assert await collect(translator) == ["HELLO THERE"]
+    assert len(completions.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_attempts(make_translator, sleeps) -> None:
+    translator, completions = make_translator(
+        failing_first(*(status_error(InternalServerError, 500) for _ in range(MAX_ATTEMPTS)))
+    )
+    with pytest.raises(InternalServerError):
+        await collect(translator)
+    assert len(completions.calls) == MAX_ATTEMPTS
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried(make_translator, sleeps) -> None:
+    translator, completions = make_translator(
+        failing_first(status_error(AuthenticationError, 401))
+    )
+    with pytest.raises(AuthenticationError):
+        await collect(translator)
+    assert len(completions.calls) == 1
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_stream_broken_after_text_is_not_resent(make_translator, sleeps) -> None:
+    broken = FakeStream(["partial"], error=httpx.ReadError("connection reset"))
+    translator, completions = make_translator(lambda request: broken)
+    with pytest.raises(StreamInterruptedError):
+        await collect(translator)
+    assert len(completions.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_interrupted_batch_starts_over(make_translator, sleeps) -> None:
+    responses = [
+        json_stream(["FIRST"], error=httpx.ReadError("connection reset")),
+        json_stream(EXPECTED),
+    ]
+    translator, completions = make_translator(lambda request: responses.pop(0))
+    assert await translator.translate_batch(TEXTS, "zh") == EXPECTED
+    assert len(completions.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_leaves_texts_untranslated(make_translator, sleeps) -> None:
+    def handler(request: dict[str, Any]) -> FakeStream:
+        raise status_error(AuthenticationError, 401)
+
+    translator, _ = make_translator(handler)
+    assert await translator.translate_batch(TEXTS, "zh") == TEXTS
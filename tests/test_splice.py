@@ -0,0 +1,34 @@
+"""Tests for single-pass range replacement."""
+
+from src.parser.base import splice_ranges
+
+
+def test_no_edits_returns_content() -> None:
+    assert splice_ranges("unchanged", []) == "unchanged"
+
+
+def test_replaces_text_ranges() -> None:
+    content = "# hello\nx = 1  # world\n"
+    edits = [(0, 7, "# 你好"), (15, 22, "# 世界")]
+    assert splice_ranges(content, edits) == "# 你好\nx = 1  # 世界\n"
+
+
+def test_replaces_byte_ranges() -> None:
+    content = "é // one\n".encode()
+    start = content.index(b"//")
+    edits = [(start, start + 6, "// 一".encode())]
+    assert splice_ranges(content, edits) == "é // 一\n".encode()
+
+
+def test_edits_may_come_in_any_order() -> None:
+    assert splice_ranges("abcdef", [(4, 5, "E"), (0, 1, "A"), (2, 3, "C")]) == "AbCdEf"
+
+
+def test_overlapping_edits_are_skipped() -> None:
+    # The edit starting first wins; on a tie, the one listed first
+    assert splice_ranges("abcdef", [(1, 4, "X"), (2, 5, "Y"), (5, 6, "Z")]) == "aXeZ"
+    assert splice_ranges("abcdef", [(1, 3, "X"), (1, 2, "Y")]) == "aXdef"
+
+
+def test_insertions_and_deletions() -> None:
+    assert splice_ranges("abc", [(0, 0, ">"), (1, 2, ""), (3, 3, "<")]) == ">ac<"
@@ -0,0 +1,81 @@
+"""Tests for streamed batch translation and its recovery paths."""
+
+from typing import Any
+
+import pytest
+
+from src.translator.openai import MAX_TOKENS, _estimate_max_tokens
+from tests.fakes import FakeStream, batch_inputs, json_stream, upper_handler
+
+
+def texts(count: int) -> list[str]:
+    return [f"comment number {i} here" for i in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_stream_batch_yields_each_translation(make_translator) -> None:
+    translator, completions = make_translator()
+    batch = texts(3)
+    streamed = [item async for item in translator.stream_batch(batch, "zh")]
+    assert streamed == [text.upper() for text in batch]
+    assert batch_inputs(completions.calls[0]) == batch
+
+
+@pytest.mark.asyncio
+async def test_truncated_response_retries_with_a_larger_budget(make_translator) -> None:
+    def handler(request: dict[str, Any]) -> FakeStream:
+        if request["max_tokens"] < MAX_TOKENS:
+            return json_stream(["CUT"], finish_reason="length")
+        return upper_handler(request)
+
+    batch = texts(2)
+    translator, completions = make_translator(handler)
+    assert await translator.translate_batch(batch, "zh") == [text.upper() for text in batch]
+
+    budgets = [call["max_tokens"] for call in completions.calls]
+    assert budgets[0] == _estimate_max_tokens(batch)
+    assert budgets[-1] == MAX_TOKENS
+    # Doubled each time, capped at MAX_TOKENS
+    assert all(b == min(MAX_TOKENS, a * 2) for a, b in zip(budgets, budgets[1:]))
+
+
+@pytest.mark.asyncio
+async def test_count_mismatch_halves_the_batch(make_translator) -> None:
+    def drop_last(request: dict[str, Any]) -> FakeStream:
+        inputs = batch_inputs(request)
+        translations = [text.upper() for text in inputs]
+        return json_stream(translations[:-1] if len(inputs) > 1 else translations)
+
+    batch = texts(4)
+    translator, completions = make_translator(drop_last)
+    assert await translator.translate_batch(batch, "zh") == [text.upper() for text in batch]
+    # 4 -> 2 + 2 -> 1 + 1 + 1 + 1
+    assert sorted(len(batch_inputs(call)) for call in completions.calls) == [1, 1, 1, 1, 2, 2, 4]
+
+
+@pytest.mark.asyncio
+async def test_single_text_mismatch_falls_back_to_plain_request(make_translator) -> None:
+    def handler(request: dict[str, Any]) -> FakeStream:
+        if "response_format" in request:
+            return json_stream([])
+        return upper_handler(request)
+
+    translator, completions = make_translator(handler)
+    assert await translator.translate_batch(["lonely comment here"], "zh") == [
+        "LONELY COMMENT HERE"
+    ]
+    assert len(completions.calls) == 2
+    assert completions.calls[1]["messages"][-1]["content"] == "lonely comment here"
+
+
+@pytest.mark.asyncio
+async def test_repeated_and_passthrough_texts_skip_requests(make_translator) -> None:
+    translator, completions = make_translator()
+    batch = ["same comment here", "https://example.com", "same comment here", "snake_case"]
+    assert await translator.translate_batch(batch, "zh") == [
+        "SAME COMMENT HERE",
+        "https://example.com",
+        "SAME COMMENT HERE",
+        "snake_case",
+    ]
+    assert [batch_inputs(call) for call in completions.calls] == [["same comment here"]]